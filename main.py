@@ -28,6 +28,7 @@ from src.exceptions import (
     FILE_IO_ERRORS,
     FILE_READ_ERRORS,
     PARSE_ERRORS,
+    RateLimitedError,
 )
 from src.http_utils import http_get_text
 
@@ -714,7 +715,13 @@ def process_record(api_key: str, rec: Record, out_dir: str, max_pubs: Optional[i
                 remaining = total_requested - start
                 num_this_batch = min(batch_size, remaining)
 
-                data = api.fetch_author_publications(api_key, rec.scholar_id, num=num_this_batch, start=start)
+                try:
+                    data = api.fetch_author_publications(api_key, rec.scholar_id, num=num_this_batch, start=start)
+                except RateLimitedError as e:
+                    # keep any pages already fetched and continue with DBLP and the other sources
+                    logger.warn(f"Rate limited (retry_after={e.retry_after}); stopping Scholar pagination",
+                                category=LogCategory.ERROR, source=LogSource.SCHOLAR)
+                    break
 
                 status = (data.get("search_metadata") or {}).get("status")
                 if status and status.lower() == "error":
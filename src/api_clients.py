@@ -36,7 +36,7 @@ from .config import (
 )
 from .exceptions import (
     NETWORK_ERRORS, PARSE_ERRORS, DECODE_ERRORS, ALL_API_ERRORS, NUMERIC_ERRORS,
-    XML_PARSE_ERRORS, FIELD_ACCESS_ERRORS
+    XML_PARSE_ERRORS, FIELD_ACCESS_ERRORS, RateLimitedError
 )
 from .http_utils import (
     http_get_json, http_get_text, http_fetch_bytes, s2_http_get_json,
@@ -115,7 +115,8 @@ def fetch_author_publications(api_key: str, author_id: str, num: int = 100, star
     """
     from .http_utils import handle_api_errors
 
-    @handle_api_errors(default_return={})
+    # a rate-limited run is reported to the caller rather than looking like an empty profile
+    @handle_api_errors(default_return={}, reraise=(RateLimitedError,))
     def _fetch():
         params = {
             "engine": "google_scholar_author",
@@ -354,6 +355,9 @@ def fetch_scholar_citation_via_serpapi(
 
         return fields if fields else None
 
+    except RateLimitedError:
+        # let callers see the 429 and its Retry-After instead of a missing citation
+        raise
     except ALL_API_ERRORS:
         return None
 
@@ -1950,9 +1954,8 @@ def orcid_fetch_works(orcid_id: str) -> List[Dict[str, Any]]:
     # ORCID requires Accept header for content negotiation
     headers = DEFAULT_JSON_HEADERS.copy()
     headers["User-Agent"] = "CiteForge/1.0"
-    req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req, timeout=15.0) as response:
-        data = json.loads(response.read().decode("utf-8"))
+    raw = http_fetch_bytes(url, headers, timeout=15.0)
+    data = json.loads(raw.decode("utf-8"))
 
     works = []
     for work_group in (data.get("group") or []):
@@ -2045,7 +2048,7 @@ def s2_search_papers_multiple(
     Search Semantic Scholar for multiple paper candidates matching the given title
     and author, returning top N results sorted by relevance.
     """
-    if not api_key or not title:
+    if not api_key or not title or max_results <= 0:
         return []
 
     query_parts = [f'"{title}"']
@@ -2083,7 +2086,7 @@ def pubmed_search_papers_multiple(title: str, author_name: Optional[str], max_re
     """
     Search PubMed for multiple paper candidates, returning top N results sorted by relevance.
     """
-    if not title:
+    if not title or max_results <= 0:
         return []
 
     # Step 1: Search for PMIDs
@@ -2139,7 +2142,7 @@ def europepmc_search_papers_multiple(
     """
     Search Europe PMC for multiple paper candidates, returning top N results sorted by relevance.
     """
-    if not title:
+    if not title or max_results <= 0:
         return []
 
     from .api_configs import EUROPEPMC_SEARCH_CONFIG
@@ -2171,7 +2174,7 @@ def crossref_search_multiple(title: str, author_name: Optional[str], max_results
     """
     Search Crossref for multiple work candidates, returning top N results sorted by relevance.
     """
-    if not title:
+    if not title or max_results <= 0:
         return []
 
     from .api_generics import search_api_generic_multiple
@@ -2200,7 +2203,7 @@ def openalex_search_multiple(title: str, author_name: Optional[str], max_results
     """
     Search OpenAlex for multiple work candidates, returning top N results sorted by relevance.
     """
-    if not title:
+    if not title or max_results <= 0:
         return []
 
     from .api_generics import search_api_generic_multiple
@@ -2221,7 +2224,7 @@ def openreview_search_papers_multiple(
     Query OpenReview for notes whose titles resemble the requested paper,
     returning the top N candidates sorted by relevance score.
     """
-    if not title:
+    if not title or max_results <= 0:
         return []
 
     from .text_utils import normalize_title, author_name_matches
@@ -112,7 +112,7 @@ def create_scoring_function(
         score that reflects how well title, author, and year agree.
         """
         cand_title = title_getter(candidate)
-        tsim = title_similarity(title, cand_title)
+        tsim = title_similarity(title, cand_title, score_cutoff=SIM_TITLE_SIM_MIN)
 
         # skip if title doesn't match well enough
         if tsim < SIM_TITLE_SIM_MIN:
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import os
 import re
+import sys
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from slugify import slugify
@@ -112,6 +114,20 @@ def parse_bibtex_to_dict(bibtex: str) -> Optional[Dict[str, Any]]:
     and field values while handling nested braces and multi-line fields.
     Also handles single-line BibTeX entries common in API responses.
     """
+    parsed = _parse_bibtex_cached(bibtex)
+    if parsed is None:
+        return None
+    # callers may mutate the entry, so hand out a copy of the cached parse;
+    # field values are strings, so copying the fields dict is enough
+    return {**parsed, "fields": dict(parsed["fields"])}
+
+
+@lru_cache(maxsize=1024)
+def _parse_bibtex_cached(bibtex: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a BibTeX string once; the same entries are re-parsed many times while
+    scanning output directories and validating DOI candidates.
+    """
     head = _parse_bibtex_head(bibtex)
     if not head:
         return None
@@ -159,7 +175,7 @@ def parse_bibtex_to_dict(bibtex: str) -> Optional[Dict[str, Any]]:
         for part in field_parts:
             m = re.match(r'^\s*([a-zA-Z][a-zA-Z0-9_\-]*)\s*=\s*(.*)$', part)
             if m:
-                field_name = m.group(1).lower()
+                field_name = sys.intern(m.group(1).lower())
                 field_value = m.group(2).strip()
                 _assign_field_value(fields, field_name, field_value)
 
@@ -184,7 +200,8 @@ def parse_bibtex_to_dict(bibtex: str) -> Optional[Dict[str, Any]]:
                 full_value = ' '.join(accumulator)
                 _assign_field_value(fields, current_field, full_value)
 
-            current_field = m.group(1).lower()
+            # interned so lookups like fields.get('title') hit on identity
+            current_field = sys.intern(m.group(1).lower())
             rest = m.group(2).strip()
             accumulator = [rest]
 
@@ -684,12 +701,14 @@ def bibtex_entries_match_strict(entry_a: Dict[str, Any], entry_b: Dict[str, Any]
     if not a_title or not b_title:
         return False
 
-    # Use fuzzy title matching instead of exact equality
+    # Use fuzzy title matching instead of exact equality, but only when the
+    # normalized titles differ; identical ones trivially clear the threshold
     # High threshold (0.95) ensures very similar titles while allowing minor variations
-    from .text_utils import title_similarity
-    title_sim = title_similarity(a_title, b_title)
-    if title_sim < 0.95:
-        return False
+    if a_title != b_title:
+        from .text_utils import title_similarity
+        title_sim = title_similarity(a_title, b_title, score_cutoff=0.95)
+        if title_sim < 0.95:
+            return False
 
     # Extract and compare year integers for robust matching
     a_year_int = _extract_year_int(af.get("year"))
@@ -1,24 +1,42 @@
 from __future__ import annotations
 
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, Callable, List, NamedTuple, Tuple, Optional
 
 from . import api_clients as api, bibtex_utils as bt
 from .exceptions import ALL_API_ERRORS
 from .log_utils import logger, LogSource, LogCategory
 
 
+class DOIFetchers(NamedTuple):
+    """
+    Resolver calls used to validate a DOI; callers (and tests) can inject
+    their own instead of patching api_clients.
+    """
+    csl: Callable[[str], Any]
+    bibtex: Callable[[str], Optional[str]]
+    bibtex_from_csl: Callable[..., Optional[str]]
+
+
+def _default_fetchers() -> DOIFetchers:
+    """
+    Build the fetchers backed by api_clients, looked up at call time.
+    """
+    return DOIFetchers(api.fetch_csl_via_doi, api.fetch_bibtex_via_doi, api.bibtex_from_csl)
+
+
 def _validate_csl(
     doi: str,
     baseline_entry: Dict[str, Any],
-    result_id: str
+    result_id: str,
+    fetchers: DOIFetchers
 ) -> Tuple[bool, Optional[Dict[str, Any]], Any]:
     """
     Helper to validate DOI using CSL-JSON format.
     """
     try:
-        csl = api.fetch_csl_via_doi(doi)
+        csl = fetchers.csl(doi)
         if csl:
-            csl_bib = api.bibtex_from_csl(csl, keyhint=result_id)
+            csl_bib = fetchers.bibtex_from_csl(csl, keyhint=result_id)
             if csl_bib:
                 csl_entry = bt.parse_bibtex_to_dict(csl_bib)
                 if csl_entry and bt.bibtex_entries_match_strict(baseline_entry, csl_entry):
@@ -32,13 +50,14 @@ def _validate_csl(
 
 def _validate_bibtex(
     doi: str,
-    baseline_entry: Dict[str, Any]
+    baseline_entry: Dict[str, Any],
+    fetchers: DOIFetchers
 ) -> Tuple[bool, Optional[Dict[str, Any]], Any]:
     """
     Helper to validate DOI using BibTeX format.
     """
     try:
-        doi_bib = api.fetch_bibtex_via_doi(doi)
+        doi_bib = fetchers.bibtex(doi)
         if doi_bib:
             bibtex_entry = bt.parse_bibtex_to_dict(doi_bib)
             if bibtex_entry and bt.bibtex_entries_match_strict(baseline_entry, bibtex_entry):
@@ -55,7 +74,8 @@ def _log_rejection_details(
     baseline_entry: Dict[str, Any],
     result_id: str,
     csl: Any,
-    doi_bib: Any
+    doi_bib: Any,
+    fetchers: DOIFetchers
 ):
     """
     Log details about why validation failed, checking title similarity.
@@ -66,7 +86,7 @@ def _log_rejection_details(
     # Check CSL title if available
     if csl:
         try:
-            csl_bib_check = api.bibtex_from_csl(csl, keyhint=result_id)
+            csl_bib_check = fetchers.bibtex_from_csl(csl, keyhint=result_id)
             if csl_bib_check:
                 csl_dict = bt.parse_bibtex_to_dict(csl_bib_check)
                 csl_title = bt.normalize_title(csl_dict.get("fields", {}).get("title"))
@@ -91,23 +111,28 @@ def _log_rejection_details(
 def validate_doi_candidate(
     doi: str,
     baseline_entry: Dict[str, Any],
-    result_id: str
+    result_id: str,
+    fetchers: Optional[DOIFetchers] = None
 ) -> Tuple[bool, bool, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
     """
     Validate a DOI by fetching metadata in multiple formats and checking baseline match,
-    returning validation success flags and parsed entries.
+    returning validation success flags and parsed entries. Resolver calls default to
+    api_clients unless fetchers are given.
     """
+    if fetchers is None:
+        fetchers = _default_fetchers()
+
     # Try CSL-JSON format
-    csl_matched, csl_entry, csl = _validate_csl(doi, baseline_entry, result_id)
+    csl_matched, csl_entry, csl = _validate_csl(doi, baseline_entry, result_id, fetchers)
 
     # Try BibTeX format
-    bibtex_matched, bibtex_entry, doi_bib = _validate_bibtex(doi, baseline_entry)
+    bibtex_matched, bibtex_entry, doi_bib = _validate_bibtex(doi, baseline_entry, fetchers)
 
     # Determine overall validation result
     doi_matched = csl_matched or bibtex_matched
 
     if not doi_matched:
-        _log_rejection_details(doi, baseline_entry, result_id, csl, doi_bib)
+        _log_rejection_details(doi, baseline_entry, result_id, csl, doi_bib, fetchers)
 
     return csl_matched, bibtex_matched, csl_entry, bibtex_entry
 
@@ -117,14 +142,15 @@ def process_validated_doi(
     baseline_entry: Dict[str, Any],
     result_id: str,
     enr_list: List[Tuple[str, Dict[str, Any]]],
-    flags: Dict[str, bool]
+    flags: Dict[str, bool],
+    fetchers: Optional[DOIFetchers] = None
 ) -> bool:
     """
     Validate a DOI and update enrichment tracking structures, returning True if DOI
     validated successfully in at least one format.
     """
     csl_matched, bibtex_matched, csl_entry, bibtex_entry = validate_doi_candidate(
-        doi, baseline_entry, result_id
+        doi, baseline_entry, result_id, fetchers
     )
 
     # Add validated entries to enrichment list
@@ -5,6 +5,8 @@ import json
 import socket
 import urllib.error
 import xml.etree.ElementTree as ElementTree
+from typing import Optional
+
 import requests
 
 __all__ = [
@@ -25,8 +27,22 @@ __all__ = [
     "CSV_ERRORS",
     "FIELD_ACCESS_ERRORS",
     "FILE_WRITE_ERRORS",
+    "RateLimitedError",
 ]
 
+
+class RateLimitedError(requests.exceptions.HTTPError):
+    """
+    Raised when an API still answers 429 Too Many Requests after all retries; carries
+    the status code and the server's Retry-After delay in seconds when one was sent.
+    Being an HTTPError, it is still covered by HTTP_ERRORS and the groups built on it.
+    """
+
+    def __init__(self, *args, status_code: int = 429, retry_after: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
 # errors raised by urllib when an HTTP request fails or a URL cannot be reached
 HTTP_ERRORS = (urllib.error.HTTPError, urllib.error.URLError, requests.exceptions.RequestException)
 
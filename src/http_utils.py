@@ -6,13 +6,13 @@ import time
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Dict, Any, Optional, Callable, TypeVar
+from typing import Dict, Any, Optional, Callable, Tuple, TypeVar
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from .exceptions import DECODE_ERRORS, NUMERIC_ERRORS, NETWORK_ERRORS, ALL_API_ERRORS
+from .exceptions import DECODE_ERRORS, NUMERIC_ERRORS, NETWORK_ERRORS, ALL_API_ERRORS, RateLimitedError
 from .config import (
     HTTP_TIMEOUT_DEFAULT,
     HTTP_BACKOFF_INITIAL,
@@ -47,22 +47,29 @@ _RETRY_STRATEGY = Retry(
     total=HTTP_MAX_RETRIES,
     backoff_factor=HTTP_BACKOFF_INITIAL,
     status_forcelist=HTTP_RETRY_STATUS_CODES,
-    allowed_methods=["GET", "POST"]
+    allowed_methods=["GET", "POST"],
+    # hand the final response back instead of raising urllib3's RetryError, for every
+    # forcelisted status: an exhausted 429 becomes RateLimitedError below, and an
+    # exhausted 5xx reaches raise_for_status and surfaces as requests' HTTPError
+    raise_on_status=False,
 )
 _ADAPTER = HTTPAdapter(max_retries=_RETRY_STRATEGY)
 _SESSION.mount("https://", _ADAPTER)
 _SESSION.mount("http://", _ADAPTER)
 
 
-def handle_api_errors(default_return=None):
+def handle_api_errors(default_return=None, reraise: Tuple[type, ...] = ()):
     """
     Decorator to handle API errors consistently across all API client functions, returning a default value on error.
+    Exception types listed in reraise propagate to the caller even when they are also API errors.
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
+            except reraise:
+                raise
             except ALL_API_ERRORS:
                 return default_return
         return wrapper
@@ -115,6 +122,14 @@ def http_fetch_bytes(
                 time.sleep(min(wait_time, HTTP_BACKOFF_MAX))
                 continue
 
+            if resp.status_code == 429:
+                retry_after = _parse_retry_after(resp.headers.get('Retry-After'))
+                raise RateLimitedError(
+                    f"429 Too Many Requests for {resp.url}",
+                    response=resp,
+                    retry_after=retry_after or None,
+                )
+
             resp.raise_for_status()
             return resp.content
         except requests.exceptions.RequestException as e:
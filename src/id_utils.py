@@ -5,6 +5,21 @@ from typing import Dict, Any, Optional
 
 from .config import _DOI_REGEX, ARXIV_DOI_EXTRACT_PATTERN
 
+# arXiv IDs in free text ("arXiv:1706.03762v5") and in arxiv.org abs/pdf links
+_ARXIV_TEXT_RE = re.compile(r'arxiv[:/\s]*([0-9]{4}\.[0-9]{4,5})', re.IGNORECASE)
+_ARXIV_URL_RE = re.compile(r'arxiv\.org/(?:abs|pdf)/([0-9]{4}\.[0-9]{4,5})', re.IGNORECASE)
+
+# remaining DOI/arXiv patterns, compiled once at import time
+_DOI_RE = re.compile(_DOI_REGEX, re.IGNORECASE)
+_DOI_URL_PREFIX_RE = re.compile(r"^https?://(?:dx\.)?doi\.org/", re.IGNORECASE)
+_DOI_PREFIX_RE = re.compile(r"^doi:\s*", re.IGNORECASE)
+_DOI_URL_RE = re.compile(r'^https?://(?:dx\.)?doi\.org/(\S+)$', re.IGNORECASE)
+_ARXIV_PREFIX_RE = re.compile(r'^arxiv:\s*', re.IGNORECASE)
+_ARXIV_VERSION_RE = re.compile(r'v\d+$')
+_ARXIV_ID_RE = re.compile(r'arxiv:\s*([0-9]{4}\.[0-9]{4,5})', re.IGNORECASE)
+_ARXIV_ABS_URL_RE = re.compile(r'^https?://arxiv\.org/(abs|pdf)/(\S+)$', re.IGNORECASE)
+_ARXIV_DOI_RE = re.compile(ARXIV_DOI_EXTRACT_PATTERN)
+
 
 def _norm_doi(doi: Optional[str]) -> Optional[str]:
     """
@@ -16,9 +31,9 @@ def _norm_doi(doi: Optional[str]) -> Optional[str]:
         return None
     d = str(doi).strip()
     # strip URL prefixes
-    d = re.sub(r"^https?://(dx\.)?doi\.org/", "", d, flags=re.IGNORECASE)
+    d = _DOI_URL_PREFIX_RE.sub("", d)
     # remove "doi:" prefix
-    d = re.sub(r"^doi:\s*", "", d, flags=re.IGNORECASE)
+    d = _DOI_PREFIX_RE.sub("", d)
     d = d.strip()
     if not d:
         return None
@@ -42,17 +57,17 @@ def _norm_arxiv_id(s: Optional[str]) -> Optional[str]:
     if not s:
         return None
     t = str(s).strip()
-    t = re.sub(r'(?i)^arxiv:\s*', '', t)  # strip "arXiv:"
-    t = re.sub(r'v\d+$', '', t)  # strip version
+    t = _ARXIV_PREFIX_RE.sub('', t)  # strip "arXiv:"
+    t = _ARXIV_VERSION_RE.sub('', t)  # strip version
     return t.strip() or None
 
 
 # meta tag patterns for finding DOIs in HTML
-_DOI_META_PATTERNS = [
+_DOI_META_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
     r'<meta[^>]+name=["\']citation_doi["\'][^>]+content=["\']([^"\']+)["\']',
     r'<meta[^>]+name=["\']dc\.identifier["\'][^>]+content=["\']doi:?\s*([^"\']+)["\']',
     r'<meta[^>]+property=["\']og:doi["\'][^>]+content=["\']([^"\']+)["\']',
-]
+))
 
 
 def find_doi_in_html(html: str) -> Optional[str]:
@@ -63,12 +78,12 @@ def find_doi_in_html(html: str) -> Optional[str]:
     if not html:
         return None
     for pat in _DOI_META_PATTERNS:
-        m = re.search(pat, html, flags=re.IGNORECASE)
+        m = pat.search(html)
         if m:
             d = _norm_doi(m.group(1))
-            if d and re.search(_DOI_REGEX, d, flags=re.IGNORECASE):
+            if d and _DOI_RE.search(d):
                 return d
-    m = re.search(_DOI_REGEX, html, flags=re.IGNORECASE)
+    m = _DOI_RE.search(html)
     return _norm_doi(m.group(1)) if m else None
 
 
@@ -79,7 +94,7 @@ def find_doi_in_text(text: str) -> Optional[str]:
     """
     if not text:
         return None
-    m = re.search(_DOI_REGEX, text, flags=re.IGNORECASE)
+    m = _DOI_RE.search(text)
     return _norm_doi(m.group(1)) if m else None
 
 
@@ -91,13 +106,13 @@ def find_arxiv_in_text(text: str) -> Optional[str]:
     if not text:
         return None
     # look for ID with or without "arXiv:" prefix
-    m = re.search(r'(?i)arxiv[:/\s]*([0-9]{4}\.[0-9]{4,5})(?:v\d+)?', text)
+    m = _ARXIV_TEXT_RE.search(text)
     if m:
         return _norm_arxiv_id(m.group(1))
     # look for arxiv.org URLs
-    m = re.search(r'(?i)arxiv\.org/(abs|pdf)/([0-9]{4}\.[0-9]{4,5})', text)
+    m = _ARXIV_URL_RE.search(text)
     if m:
-        return _norm_arxiv_id(m.group(2))
+        return _norm_arxiv_id(m.group(1))
     return None
 
 
@@ -113,14 +128,14 @@ def allowlisted_url(url: Optional[str]) -> Optional[str]:
     u = url.strip()
 
     # Check for DOI URLs and normalize them
-    doi_match = re.search(r'^https?://(dx\.)?doi\.org/(\S+)$', u, flags=re.IGNORECASE)
+    doi_match = _DOI_URL_RE.search(u)
     if doi_match:
         # Normalize to https://doi.org/...
-        doi_suffix = doi_match.group(2)
+        doi_suffix = doi_match.group(1)
         return f"https://doi.org/{doi_suffix}"
 
     # Check for arXiv URLs and normalize to HTTPS
-    arxiv_match = re.search(r'^https?://arxiv\.org/(abs|pdf)/(\S+)$', u, flags=re.IGNORECASE)
+    arxiv_match = _ARXIV_ABS_URL_RE.search(u)
     if arxiv_match:
         # Normalize to https://arxiv.org/...
         arxiv_type = arxiv_match.group(1)
@@ -142,7 +157,7 @@ def extract_arxiv_eprint(entry: Dict[str, Any]) -> Optional[str]:
         return _norm_arxiv_id(fields.get("eprint"))
     # sometimes arXiv ID is in journal or howpublished field
     j = fields.get("journal") or fields.get("howpublished") or ""
-    m = re.search(r'(?i)arxiv:\s*([0-9]{4}\.[0-9]{4,5})(v\d+)?', j)
+    m = _ARXIV_ID_RE.search(j)
     if m:
         return _norm_arxiv_id(m.group(1))
     return None
@@ -173,7 +188,7 @@ def normalize_arxiv_metadata(fields: Dict[str, Any]) -> Dict[str, Any]:
     if not arxiv_id:
         doi = fields.get("doi", "")
         if doi:
-            m = re.search(ARXIV_DOI_EXTRACT_PATTERN, doi)
+            m = _ARXIV_DOI_RE.search(doi)
             if m:
                 arxiv_id = _norm_arxiv_id(m.group(1))
 
@@ -181,7 +196,7 @@ def normalize_arxiv_metadata(fields: Dict[str, Any]) -> Dict[str, Any]:
     # Always check and remove pages if it contains arXiv ID (not valid page numbers)
     pages = fields.get("pages", "")
     if pages:
-        m = re.search(r'(?i)arxiv:\s*([0-9]{4}\.[0-9]{4,5})', pages)
+        m = _ARXIV_ID_RE.search(pages)
         if m:
             if not arxiv_id:
                 arxiv_id = _norm_arxiv_id(m.group(1))
@@ -192,7 +207,7 @@ def normalize_arxiv_metadata(fields: Dict[str, Any]) -> Dict[str, Any]:
     if not arxiv_id:
         journal = fields.get("journal", "")
         if journal:
-            m = re.search(r'(?i)arxiv:\s*([0-9]{4}\.[0-9]{4,5})', journal)
+            m = _ARXIV_ID_RE.search(journal)
             if m:
                 arxiv_id = _norm_arxiv_id(m.group(1))
 
@@ -200,9 +215,9 @@ def normalize_arxiv_metadata(fields: Dict[str, Any]) -> Dict[str, Any]:
     if not arxiv_id:
         url = fields.get("url", "")
         if url:
-            m = re.search(r'(?i)arxiv\.org/(abs|pdf)/([0-9]{4}\.[0-9]{4,5})', url)
+            m = _ARXIV_URL_RE.search(url)
             if m:
-                arxiv_id = _norm_arxiv_id(m.group(2))
+                arxiv_id = _norm_arxiv_id(m.group(1))
 
     # if we found an arXiv ID, normalize the fields
     if arxiv_id:
@@ -225,7 +240,7 @@ def normalize_arxiv_metadata(fields: Dict[str, Any]) -> Dict[str, Any]:
         is_arxiv_journal = (
             journal_lower in ("arxiv", "arxiv.org", "arxiv e-prints") or
             "arxiv preprint" in journal_lower or
-            re.search(r'arxiv:\s*[0-9]{4}\.[0-9]{4,5}', journal_lower)
+            _ARXIV_ID_RE.search(journal_lower)
         )
         if is_arxiv_journal:
             # standardize to "arXiv e-prints" for consistency
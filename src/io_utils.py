@@ -32,6 +32,10 @@ _SUMMARY_CSV_FIELDNAMES = [
 # Lock for synchronizing CSV writes
 _CSV_LOCK = threading.Lock()
 
+# ID extraction from the Scholar and DBLP profile links in the input CSV
+_SCHOLAR_USER_RE = re.compile(r"user=([^&]+)")
+_DBLP_PID_RE = re.compile(r"/pid/(.+?)(?:\.[a-z0-9]+)?$")
+
 
 def _project_root() -> str:
     """
@@ -141,8 +145,8 @@ def read_gemini_api_key(path: str = DEFAULT_GEMINI_KEY_FILE) -> Optional[str]:
 
 def read_records(path: str = DEFAULT_INPUT) -> List[Record]:
     """
-    Load author records from a CSV file, skip empty rows, and keep only entries
-    with at least one valid identifier (Scholar or DBLP).
+    Load author records from a CSV file row by row, skip empty rows, and keep only
+    entries with at least one valid identifier (Scholar or DBLP).
     """
     records: List[Record] = []
     candidates = _candidate_paths(path)
@@ -162,7 +166,7 @@ def read_records(path: str = DEFAULT_INPUT) -> List[Record]:
                     # Extract Scholar ID
                     scholar_id = ""
                     if scholar_link:
-                        m = re.search(r"user=([^&]+)", scholar_link)
+                        m = _SCHOLAR_USER_RE.search(scholar_link)
                         if m:
                             scholar_id = m.group(1)
 
@@ -171,12 +175,16 @@ def read_records(path: str = DEFAULT_INPUT) -> List[Record]:
                     if dblp_link:
                         # Handle full URL or just ID if user provided that
                         if "/pid/" in dblp_link:
-                            m = re.search(r"/pid/(.+?)(?:\.[a-z0-9]+)?$", dblp_link)
+                            m = _DBLP_PID_RE.search(dblp_link)
                             if m:
                                 dblp_id = m.group(1)
                         else:
                             dblp_id = dblp_link
 
+                    # need at least one ID to do anything useful
+                    if not (scholar_id or dblp_id):
+                        continue
+
                     records.append(
                         Record(
                             name=name,
@@ -190,8 +198,6 @@ def read_records(path: str = DEFAULT_INPUT) -> List[Record]:
     else:
         raise FileNotFoundError(f"Input file not found (tried: {', '.join(candidates)})")
 
-    # need at least one ID to do anything useful
-    records = [r for r in records if r.scholar_id or r.dblp]
     if not records:
         raise ValueError("No valid records with Scholar ID or DBLP ID found in input file.")
     return records
@@ -252,8 +258,11 @@ def safe_write_json(path: str, data: Any, makedirs: bool = True, indent: Optiona
                 return False
 
     try:
+        # serialize up front so the file gets a single write instead of one per
+        # encoder chunk, and is left untouched when the data is not serializable
+        content = json.dumps(data, indent=indent)
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent)
+            f.write(content)
         return True
     except (OSError, TypeError):
         return False
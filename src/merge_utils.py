@@ -2,12 +2,48 @@ from __future__ import annotations
 
 import os
 import re
+import sys
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from .bibtex_utils import short_filename_for_entry, bibtex_from_dict
 from .config import TRUST_ORDER, ARXIV_DOI_CHECK_PATTERN
 from .id_utils import _norm_doi, extract_arxiv_eprint, allowlisted_url
-from .text_utils import has_placeholder, format_author_dirname, title_similarity
+from .text_utils import has_placeholder, format_author_dirname, title_similarity, normalize_title
+
+
+_ARXIV_DOI_RE = re.compile(ARXIV_DOI_CHECK_PATTERN, re.IGNORECASE)
+
+# text fields that may carry publisher markup such as <scp>, <i> or <sup>
+_TEXT_FIELDS_TO_CLEAN = ("title", "journal", "booktitle", "series")
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# merged fields that determine_entry_type inspects when re-validating the entry type
+_VENUE_CONTEXT_FIELDS = ("journal", "booktitle", "howpublished", "publisher", "pages")
+
+# URL lookups repeat heavily across a batch (the same canonical links show up
+# for many entries), and allowlisting is pure regex work on a string
+_allowlisted_url_cached = lru_cache(maxsize=4096)(allowlisted_url)
+
+
+def _canon_doi(doi: Optional[str]) -> str:
+    """
+    Lowercase and strip a raw DOI field and intern the result, so the repeated
+    equality checks during a directory scan compare canonical shared strings.
+    """
+    return sys.intern(doi.strip().lower()) if doi else ""
+
+
+def _title_lengths_compatible(norm_a: str, norm_b: str, threshold: float) -> bool:
+    """
+    Cheap upper bound for title_similarity on already normalized titles. The
+    fuzzy ratio can never exceed 2 * min(len) / (len_a + len_b), so when that
+    bound does not reach the threshold the expensive comparison can be skipped.
+    """
+    total = len(norm_a) + len(norm_b)
+    if not total:
+        return True
+    return 2 * min(len(norm_a), len(norm_b)) / total >= threshold
 
 
 def merge_with_policy(primary: Dict[str, Any], enrichers: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
@@ -19,7 +55,8 @@ def merge_with_policy(primary: Dict[str, Any], enrichers: List[Tuple[str, Dict[s
     The result is a single cleaned entry that prefers reliable venues and removes
     arXiv eprint fields when a published DOI is present.
     """
-    fields = dict(primary.get("fields") or {})
+    primary_fields = primary.get("fields") or {}
+    fields = dict(primary_fields)
     etype = (primary.get("type") or "misc").lower()
     type_rank = {src: i for i, src in enumerate(TRUST_ORDER)}
     best_type_src = "scholar_min"
@@ -36,54 +73,63 @@ def merge_with_policy(primary: Dict[str, Any], enrichers: List[Tuple[str, Dict[s
                 etype = ktype
                 best_type_src = src
 
-    # track where each field came from to know when to replace
-    field_sources: Dict[str, str] = {k: "scholar_min" for k in fields}
-    merged = dict(fields)
-
+    # gather the usable values for each field in enricher order, resolving each
+    # source's trust rank once instead of per (field, source) comparison
+    field_candidates: Dict[str, List[Tuple[int, str, Any]]] = {}
     for src, e in enrichers:
         if not e:
             continue
-        efields = e.get("fields") or {}
-        for k, v in efields.items():
-            cur = merged.get(k)
-            cur_src = field_sources.get(k, "scholar_min")
+        src_rank = type_rank.get(src, 99)
+        for k, v in (e.get("fields") or {}).items():
+            if value_ok(v):
+                field_candidates.setdefault(k, []).append((src_rank, src, v))
+
+    # preprint servers (not peer-reviewed journals) for the journal downgrade rule
+    preprint_servers = {
+        'arxiv', 'biorxiv', 'medrxiv', 'chemrxiv', 'research square',
+        'ssrn', 'preprints', 'psyarxiv', 'socarxiv', 'edarxiv',
+        'arxiv e-prints', 'e-prints', 'preprint'
+    }
 
-            if not value_ok(v):
-                continue
+    merged = dict(fields)
+    baseline_rank = type_rank.get("scholar_min", 99)
+
+    # fields are independent of each other, so each one is resolved with a single
+    # walk over its candidates; the current value and its rank stay in locals
+    for k, candidates in field_candidates.items():
+        is_doi = k == "doi"
+        cur = merged.get(k)
+        cur_rank = baseline_rank
+        # whether the held DOI is an arXiv DOI; updated alongside every assignment
+        # so each candidate DOI is checked against the pattern exactly once
+        cur_is_arxiv = is_doi and cur is not None and _ARXIV_DOI_RE.search(str(cur)) is not None
+        replaced = False
+
+        for src_rank, src, v in candidates:
+            new_is_arxiv = is_doi and _ARXIV_DOI_RE.search(str(v)) is not None
             if not value_ok(cur):
-                merged[k] = v
-                field_sources[k] = src
+                cur, cur_rank, cur_is_arxiv, replaced = v, src_rank, new_is_arxiv, True
                 continue
 
             # special handling for DOI field: prefer non-arXiv DOIs over arXiv DOIs
-            if k == "doi":
-                cur_is_arxiv = bool(re.search(ARXIV_DOI_CHECK_PATTERN, str(cur), re.IGNORECASE))
-                new_is_arxiv = bool(re.search(ARXIV_DOI_CHECK_PATTERN, str(v), re.IGNORECASE))
+            if is_doi:
                 # if current is arXiv DOI but new one isn't, always prefer the non-arXiv DOI
                 if cur_is_arxiv and not new_is_arxiv:
-                    merged[k] = v
-                    field_sources[k] = src
+                    cur, cur_rank, cur_is_arxiv, replaced = v, src_rank, new_is_arxiv, True
                     continue
                 # if new is arXiv DOI but current isn't, keep current
                 if not cur_is_arxiv and new_is_arxiv:
                     continue
 
             # special handling for pages field: must be actual page numbers only
-            if k == "pages":
-                new_str = str(v)
+            elif k == "pages":
                 # Validate: pages must start with a digit (page numbers only)
-                if not re.match(r'^\d', new_str):
+                if not re.match(r'^\d', str(v)):
                     # New value is not a valid page number (starts with non-digit)
                     continue
 
             # special handling for journal field: never downgrade from published journal to preprint server
-            if k == "journal":
-                # List of preprint servers (not peer-reviewed journals)
-                preprint_servers = {
-                    'arxiv', 'biorxiv', 'medrxiv', 'chemrxiv', 'research square',
-                    'ssrn', 'preprints', 'psyarxiv', 'socarxiv', 'edarxiv',
-                    'arxiv e-prints', 'e-prints', 'preprint'
-                }
+            elif k == "journal":
                 cur_journal_lower = str(cur).lower() if cur else ''
                 new_journal_lower = str(v).lower()
 
@@ -96,7 +142,7 @@ def merge_with_policy(primary: Dict[str, Any], enrichers: List[Tuple[str, Dict[s
                     continue
 
             # special handling for title field: prefer longer, more descriptive titles
-            if k == "title":
+            elif k == "title":
                 cur_len = len(str(cur)) if cur else 0
                 new_len = len(str(v))
 
@@ -104,15 +150,16 @@ def merge_with_policy(primary: Dict[str, Any], enrichers: List[Tuple[str, Dict[s
                 # only replace if it comes from a MUCH more trusted source
                 # (at least 3 positions higher in trust order)
                 if cur_len > 0 and new_len < (cur_len * 0.7):
-                    trust_diff = type_rank.get(cur_src, 99) - type_rank.get(src, 99)
-                    if trust_diff < 3:
+                    if cur_rank - src_rank < 3:
                         # New source isn't significantly more trusted, keep longer title
                         continue
 
             # only replace if new source is more trustworthy
-            if type_rank.get(src, 99) < type_rank.get(cur_src, 99):
-                merged[k] = v
-                field_sources[k] = src
+            if src_rank < cur_rank:
+                cur, cur_rank, cur_is_arxiv, replaced = v, src_rank, new_is_arxiv, True
+
+        if replaced:
+            merged[k] = cur
 
     # normalize DOI and drop if invalid
     doi_norm = _norm_doi(merged.get("doi"))
@@ -123,7 +170,7 @@ def merge_with_policy(primary: Dict[str, Any], enrichers: List[Tuple[str, Dict[s
 
     # Validate DOI consistency: if enrichers have contradicting DOIs, keep the primary
     # Different DOIs indicate different papers that should not be merged
-    primary_doi = _norm_doi(primary.get("fields", {}).get("doi"))
+    primary_doi = _norm_doi(primary_fields.get("doi"))
     has_doi_conflict = False
 
     if primary_doi and merged.get("doi"):
@@ -189,14 +236,15 @@ def merge_with_policy(primary: Dict[str, Any], enrichers: List[Tuple[str, Dict[s
 
     # strip HTML/XML tags from text fields (prevents LaTeX compilation errors)
     # Common tags from publishers: <scp>, <i>, <b>, <sup>, <sub>, <em>, <strong>
-    text_fields_to_clean = ["title", "journal", "booktitle", "series"]
-    for field in text_fields_to_clean:
+    for field in _TEXT_FIELDS_TO_CLEAN:
         field_val = merged.get(field, "")
-        if field_val and isinstance(field_val, str):
-            # Remove HTML/XML tags: <tag>, </tag>, <tag attr="value">
-            cleaned = re.sub(r'<[^>]+>', '', field_val)
-            if cleaned != field_val:
-                merged[field] = cleaned.strip()
+        # most values carry no markup at all, and a substring test is far cheaper than the regex
+        if not field_val or not isinstance(field_val, str) or "<" not in field_val:
+            continue
+        # Remove HTML/XML tags: <tag>, </tag>, <tag attr="value">
+        cleaned = _HTML_TAG_RE.sub('', field_val)
+        if cleaned != field_val:
+            merged[field] = cleaned.strip()
 
     # remove PMID notes from PubMed/Europe PMC enrichment
     note_val = merged.get("note", "")
@@ -205,7 +253,7 @@ def merge_with_policy(primary: Dict[str, Any], enrichers: List[Tuple[str, Dict[s
 
     # only keep URLs from trusted sources (DOI resolver or arXiv)
     url_val = (merged.get("url") or "").strip()
-    allowed = allowlisted_url(url_val)
+    allowed = _allowlisted_url_cached(url_val)
     if url_val and not allowed:
         merged.pop("url", None)
     elif allowed:
@@ -218,7 +266,7 @@ def merge_with_policy(primary: Dict[str, Any], enrichers: List[Tuple[str, Dict[s
 
     # when a published DOI exists alongside arXiv, remove eprint fields
     # (DOI is the primary identifier for published papers)
-    if doi_val and arxiv_id and not re.search(ARXIV_DOI_CHECK_PATTERN, doi_val, re.IGNORECASE):
+    if doi_val and arxiv_id and not _ARXIV_DOI_RE.search(doi_val):
         # remove eprint fields since DOI is the primary identifier
         merged.pop("eprint", None)
         merged.pop("archiveprefix", None)
@@ -228,40 +276,25 @@ def merge_with_policy(primary: Dict[str, Any], enrichers: List[Tuple[str, Dict[s
     # enrichers can provide incorrect types, so always check venue keywords
     from .bibtex_build import determine_entry_type, get_container_field
 
-    venue_type = determine_entry_type(
-        {
-            "journal": merged.get("journal"),
-            "booktitle": merged.get("booktitle"),
-            "howpublished": merged.get("howpublished"),
-            "publisher": merged.get("publisher"),
-            "pages": merged.get("pages")
-        },
-        type_field="type",
-        venue_hints={}  # no hints - rely only on keyword detection
-    )
-
-    # if venue clearly indicates conference, override enricher type
-    if venue_type == "inproceedings":
-        etype = "inproceedings"
-    # if venue clearly indicates book chapter, override enricher type
-    elif venue_type == "incollection":
-        etype = "incollection"
-    elif etype == "misc":
-        # for misc entries, use full logic with venue hints
-        venue_type_with_hints = determine_entry_type(
-            {
-                "journal": merged.get("journal"),
-                "booktitle": merged.get("booktitle"),
-                "howpublished": merged.get("howpublished"),
-                "publisher": merged.get("publisher"),
-                "pages": merged.get("pages")
-            },
+    if etype == "inproceedings" and merged.get("booktitle"):
+        # a populated booktitle rules out the book chapter heuristic and the
+        # keyword scan can only confirm a conference, so nothing can change
+        venue_type = etype
+    else:
+        # misc entries also get venue hints so a bare journal/booktitle field can
+        # promote them; a single call covers both the keyword scan and the hints
+        venue_type = determine_entry_type(
+            {k: merged.get(k) for k in _VENUE_CONTEXT_FIELDS},
             type_field="type",
-            venue_hints={"journal": "article", "booktitle": "inproceedings"}
+            venue_hints={"journal": "article", "booktitle": "inproceedings"} if etype == "misc" else {}
         )
 
-        if venue_type_with_hints != "misc":
-            etype = venue_type_with_hints
+    # if venue clearly indicates conference or book chapter, override enricher type
+    if venue_type in ("inproceedings", "incollection"):
+        etype = venue_type
+    elif etype == "misc":
+        if venue_type != "misc":
+            etype = venue_type
         else:
             # fallback to simple field presence check
             journal = (merged.get("journal") or "").strip()
@@ -311,20 +344,18 @@ def save_entry_to_file(out_dir: str, author_id: str, entry: Dict[str, Any], pref
 
     # Collect existing files to enable collision detection
     # Use sorted lists for deterministic iteration order
-    existing_files_for_collision = set()
-    existing_files_for_duplicate_scan_list = []
-
-    if os.path.exists(author_dir):
-        all_files = sorted(f for f in os.listdir(author_dir) if f.endswith('.bib'))
-        existing_files_for_duplicate_scan_list = all_files
-
-        # If prefer_path is provided, exclude it from collision avoidance only
-        # but still check it for duplicate detection
-        if prefer_path:
-            prefer_filename = os.path.basename(prefer_path)
-            existing_files_for_collision = set(all_files) - {prefer_filename}
-        else:
-            existing_files_for_collision = set(all_files)
+    # A single scandir pass replaces the exists/listdir pair; the directory was
+    # just created above, so it is guaranteed to exist at this point
+    with os.scandir(author_dir) as it:
+        bib_names = {e.name for e in it if e.name.endswith('.bib')}
+    existing_files_for_duplicate_scan_list = sorted(bib_names)
+
+    # If prefer_path is provided, exclude it from collision avoidance only
+    # but still check it for duplicate detection
+    if prefer_path:
+        existing_files_for_collision = bib_names - {os.path.basename(prefer_path)}
+    else:
+        existing_files_for_collision = bib_names
 
     # Generate unique filename by checking against existing files (excluding prefer_path)
     # short_filename_for_entry will automatically use more words from the title if needed
@@ -339,22 +370,35 @@ def save_entry_to_file(out_dir: str, author_id: str, entry: Dict[str, Any], pref
     # Use sorted list for deterministic iteration order
     duplicate_found = False
     duplicate_path = None
+    new_title_norm = normalize_title((entry.get('fields') or {}).get('title', ''))
+    new_doi_canon = _canon_doi((entry.get('fields') or {}).get('doi', ''))
+
+    # .bib contents read during the scan below; the later checks look at files
+    # from this same directory and reuse them instead of reading from disk again
+    scanned_contents: Dict[str, str] = {}
+
+    def _read_existing(file_path: str) -> str:
+        content = scanned_contents.get(os.path.basename(file_path))
+        if content is None:
+            with open(file_path, "r", encoding="utf-8") as fh:
+                content = fh.read()
+        return content
 
     for existing_filename in existing_files_for_duplicate_scan_list:
         existing_path = os.path.join(author_dir, existing_filename)
         try:
             with open(existing_path, "r", encoding="utf-8") as ef:
                 existing_content = ef.read()
+                scanned_contents[existing_filename] = existing_content
                 from . import bibtex_utils as bt
                 existing_entry = bt.parse_bibtex_to_dict(existing_content)
 
                 if existing_entry:
                     existing_fields = existing_entry.get('fields', {})
-                    new_fields = entry.get('fields', {})
 
                     # Compare by DOI (most reliable)
-                    existing_doi = existing_fields.get('doi', '').strip().lower()
-                    new_doi = new_fields.get('doi', '').strip().lower()
+                    existing_doi = _canon_doi(existing_fields.get('doi', ''))
+                    new_doi = new_doi_canon
 
                     # If both have DOIs and they're SAME, it's a duplicate
                     if existing_doi and new_doi and existing_doi == new_doi:
@@ -370,9 +414,12 @@ def save_entry_to_file(out_dir: str, author_id: str, entry: Dict[str, Any], pref
                     # Only check citation key and title if DOIs don't contradict
                     # (either both missing, or only one present)
 
-                    # Get titles for comparison (used in both checks below)
-                    existing_title = existing_fields.get('title', '')
-                    new_title = new_fields.get('title', '')
+                    # Get titles for comparison (used in both checks below); both checks
+                    # need a similarity above 0.95, which titles of clearly different
+                    # lengths can never reach, so skip the fuzzy match for those
+                    existing_title_norm = normalize_title(existing_fields.get('title', ''))
+                    if not _title_lengths_compatible(existing_title_norm, new_title_norm, 0.95):
+                        continue
 
                     # Compare by citation key - BUT also verify titles are similar
                     # This prevents false positives when Gemini generates the same
@@ -383,7 +430,7 @@ def save_entry_to_file(out_dir: str, author_id: str, entry: Dict[str, Any], pref
                     new_key = entry.get('key', '').strip()
                     if existing_key and new_key and existing_key == new_key:
                         # Citation keys match - verify titles are actually similar
-                        key_title_sim = title_similarity(existing_title, new_title)
+                        key_title_sim = title_similarity(existing_title_norm, new_title_norm, score_cutoff=0.95)
                         if key_title_sim > 0.95:
                             duplicate_found = True
                             duplicate_path = existing_path
@@ -393,7 +440,7 @@ def save_entry_to_file(out_dir: str, author_id: str, entry: Dict[str, Any], pref
                         continue
 
                     # Compare by title similarity alone
-                    sim = title_similarity(existing_title, new_title)
+                    sim = title_similarity(existing_title_norm, new_title_norm, score_cutoff=0.95)
                     if sim > 0.95:
                         duplicate_found = True
                         duplicate_path = existing_path
@@ -405,8 +452,7 @@ def save_entry_to_file(out_dir: str, author_id: str, entry: Dict[str, Any], pref
     if duplicate_found and duplicate_path:
         # Check if year changed (year corrections should trigger rename)
         try:
-            with open(duplicate_path, "r", encoding="utf-8") as ef:
-                existing_content = ef.read()
+            existing_content = _read_existing(duplicate_path)
             from . import bibtex_utils as bt
             existing_entry = bt.parse_bibtex_to_dict(existing_content)
 
@@ -445,59 +491,58 @@ def save_entry_to_file(out_dir: str, author_id: str, entry: Dict[str, Any], pref
             filename = os.path.basename(duplicate_path)
 
     # avoid overwriting unless it's the file we wrote earlier or content is identical
-    while os.path.exists(os.path.join(author_dir, filename)):
-        existing_path = os.path.join(author_dir, filename)
+    existing_path = os.path.join(author_dir, filename)
+    while os.path.exists(existing_path):
         # ok to overwrite if this is the previous version
         if prefer_path and os.path.abspath(existing_path) == os.path.abspath(prefer_path):
             break
         # if content is identical, reuse this file (avoid creating -N duplicates)
         # Compare with normalized trailing whitespace to handle newline differences
         try:
-            with open(existing_path, "r", encoding="utf-8") as ef:
-                existing_content = ef.read()
-                # Compare with rstrip to ignore trailing newline differences
-                if existing_content.rstrip() == new_content.rstrip():
-                    # Prefer canonical base filename when possible
-                    break
+            existing_content = _read_existing(existing_path)
+            # Compare with rstrip to ignore trailing newline differences
+            if existing_content.rstrip() == new_content.rstrip():
+                # Prefer canonical base filename when possible
+                break
 
-                # Check if same publication by DOI or citation key (different metadata formatting)
-                from . import bibtex_utils as bt
-                existing_entry = bt.parse_bibtex_to_dict(existing_content)
-                if existing_entry:
-                    existing_fields = existing_entry.get('fields', {})
-                    new_fields = entry.get('fields', {})
+            # Check if same publication by DOI or citation key (different metadata formatting)
+            from . import bibtex_utils as bt
+            existing_entry = bt.parse_bibtex_to_dict(existing_content)
+            if existing_entry:
+                existing_fields = existing_entry.get('fields', {})
+                new_fields = entry.get('fields', {})
 
-                    # Compare by DOI (most reliable)
-                    existing_doi = existing_fields.get('doi', '').strip().lower()
-                    new_doi = new_fields.get('doi', '').strip().lower()
+                # Compare by DOI (most reliable)
+                existing_doi = _canon_doi(existing_fields.get('doi', ''))
+                new_doi = new_doi_canon
 
-                    # If both have DOIs and they're SAME, it's the same publication
-                    if existing_doi and new_doi and existing_doi == new_doi:
-                        # Same publication, overwrite with enriched version
-                        break
+                # If both have DOIs and they're SAME, it's the same publication
+                if existing_doi and new_doi and existing_doi == new_doi:
+                    # Same publication, overwrite with enriched version
+                    break
 
-                    # If both have DOIs and they're DIFFERENT, NOT the same paper
-                    # This should never happen because short_filename_for_entry should have
-                    # created a unique filename. If it does, it's an error.
-                    if existing_doi and new_doi and existing_doi != new_doi:
-                        # Different papers with same filename - this is a bug
-                        pass  # Fall through to raise error
+                # If both have DOIs and they're DIFFERENT, NOT the same paper
+                # This should never happen because short_filename_for_entry should have
+                # created a unique filename. If it does, it's an error.
+                if existing_doi and new_doi and existing_doi != new_doi:
+                    # Different papers with same filename - this is a bug
+                    pass  # Fall through to raise error
 
-                    # Only check citation key and title if DOIs don't contradict
-                    elif existing_key or new_key:
-                        # Compare by citation key as fallback
-                        existing_key = existing_entry.get('key', '').strip()
-                        new_key = entry.get('key', '').strip()
-                        if existing_key and new_key and existing_key == new_key:
-                            # Same publication, overwrite with enriched version
-                            break
+                # Only check citation key and title if DOIs don't contradict
+                elif existing_key or new_key:
+                    # Compare by citation key as fallback
+                    existing_key = existing_entry.get('key', '').strip()
+                    new_key = entry.get('key', '').strip()
+                    if existing_key and new_key and existing_key == new_key:
+                        # Same publication, overwrite with enriched version
+                        break
 
-                        # Compare by Title Similarity
-                        existing_title = existing_fields.get('title', '')
-                        new_title = new_fields.get('title', '')
-                        sim = title_similarity(existing_title, new_title)
-                        if sim > 0.95:
-                            break
+                    # Compare by Title Similarity
+                    existing_title = existing_fields.get('title', '')
+                    new_title = new_fields.get('title', '')
+                    sim = title_similarity(existing_title, new_title, score_cutoff=0.95)
+                    if sim > 0.95:
+                        break
         except OSError:
             pass
 
@@ -515,10 +560,10 @@ def save_entry_to_file(out_dir: str, author_id: str, entry: Dict[str, Any], pref
 
     # If file exists, check which version is better before overwriting
     should_write = True
+    current_content: Optional[str] = None
     if os.path.exists(path):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                existing_content = f.read()
+            existing_content = current_content = _read_existing(path)
 
             from . import bibtex_utils as bt
             existing_entry = bt.parse_bibtex_to_dict(existing_content)
@@ -555,7 +600,9 @@ def save_entry_to_file(out_dir: str, author_id: str, entry: Dict[str, Any], pref
     if should_write:
         # Re-render content to ensure citation key matches any updates made
         final_content = bibtex_from_dict(entry)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(final_content)
+        # re-saving an unchanged entry leaves the file untouched
+        if final_content != current_content:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(final_content)
 
     return path
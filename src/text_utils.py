@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import re
+import time
 import urllib.parse
-from typing import Any, Optional, Dict, List
+from functools import lru_cache
+from typing import Any, Optional, Dict, List, NamedTuple
 
 from rapidfuzz.fuzz import ratio as fuzz_ratio
 from unidecode import unidecode
@@ -40,6 +42,43 @@ __all__ = [
     "extract_author_names",
 ]
 
+# patterns used on hot normalization paths, compiled once at import time
+_LATEX_MATH_RE = re.compile(r'\$([^$]*)\$')
+_LATEX_CMD_BRACE_RE = re.compile(r'\\[a-zA-Z]+\{([^}]*)}')
+_LATEX_CMD_RE = re.compile(r'\\[a-zA-Z]+')
+_NON_ALNUM_SPACE_RE = re.compile(r"[^a-z0-9\s]")
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+_YEAR_RE = re.compile(r"(?:19|20)\d{2}")
+_PATH_RESERVED_RE = re.compile(r'[/\\:*?"<>|]+')
+_ABBREV_NAME_RE = re.compile(r'^[A-Z]\.?\s*[A-Z]?\.?\s*[A-Z]?\.?\s+[A-Z][a-z]+', re.IGNORECASE)
+
+# unidecode transliterations for the Latin-1, Latin Extended-A/B, combining
+# diacritics and Latin Extended Additional blocks, so strip_accents can handle
+# the common accented-name case with str.translate instead of unidecode
+_LATIN_ASCII_TABLE = {
+    cp: unidecode(chr(cp))
+    for block in ((0x80, 0x250), (0x300, 0x370), (0x1E00, 0x1F00))
+    for cp in range(*block)
+}
+
+# placeholder and truncation markers, matched in one scan over the lowercased text
+_PLACEHOLDER_RE = re.compile(r"\.\.\.|…|et al|n/a|tbd|unknown|placeholder")
+_TRUNCATION_RE = re.compile(r"\.\.\.|…|et al|\[truncated\]")
+
+# punctuation and brackets that normalize_title turns into spaces in a single pass
+_PUNCT_TABLE = str.maketrans({ch: " " for ch in ",.;:!?\n\t\r'\"-()[]{}"})
+
+
+def _join_name(given: str, family: str) -> str:
+    """
+    Join given and family name parts with a single space, skipping whichever is empty.
+    """
+    if not family:
+        return given
+    if not given:
+        return family
+    return f"{given} {family}"
+
 
 def _name_from_dict(d: Dict[str, Any]) -> str:
     """
@@ -47,19 +86,25 @@ def _name_from_dict(d: Dict[str, Any]) -> str:
     "name" field or separate given/family (first/last) components.
     Returns an empty string if nothing usable is present.
     """
-    name = str(d.get("name") or "").strip()
+    name = d.get("name")
     if name:
-        return name
-    given = str(d.get("given") or d.get("first") or "").strip()
-    family = str(d.get("family") or d.get("last") or "").strip()
-    return (f"{given} {family}" if (given or family) else "").strip()
+        name = str(name).strip()
+        if name:
+            return name
+    given = d.get("given") or d.get("first")
+    family = d.get("family") or d.get("last")
+    if not given and not family:
+        return ""
+    return _join_name(str(given or "").strip(), str(family or "").strip())
 
 
 def build_url(base: str, params: Dict[str, Any]) -> str:
     """
     Attach query parameters to a base URL and return the fully encoded address as a string.
+    Parameters set to None are left out, and list values expand to repeated keys.
     """
-    q = urllib.parse.urlencode(params)
+    items = [(k, v) for k, v in params.items() if v is not None]
+    q = urllib.parse.urlencode(items, doseq=True)
     return f"{base}?{q}"
 
 
@@ -80,7 +125,7 @@ def to_text(obj: Any) -> str:
                 if not nm:
                     given = x.get("given") or x.get("first") or ""
                     family = x.get("family") or x.get("last") or ""
-                    nm = f"{given} {family}".strip()
+                    nm = _join_name(given, family)
                 parts.append(str(nm).strip())
             else:
                 parts.append(str(x).strip())
@@ -92,10 +137,7 @@ def to_text(obj: Any) -> str:
             return str(obj["summary"])
         if obj.get("text"):
             return str(obj["text"])
-        try:
-            return ", ".join(str(v) for v in obj.values() if v)
-        except PARSE_ERRORS + DECODE_ERRORS:
-            return str(obj)
+        return ", ".join([str(v) for v in obj.values() if v])
     return str(obj)
 
 
@@ -106,6 +148,12 @@ def strip_accents(s: str) -> str:
 
     Uses unidecode library for comprehensive Unicode to ASCII transliteration.
     """
+    if s.isascii():
+        return s
+    # accented Latin text is fully handled by the precomputed table in one C pass
+    t = s.translate(_LATIN_ASCII_TABLE)
+    if t.isascii():
+        return t
     try:
         return unidecode(s)
     except PARSE_ERRORS + DECODE_ERRORS:
@@ -120,22 +168,21 @@ def normalize_title(t: Optional[str]) -> str:
     if not t:
         return ""
 
-    import re
     t_str = str(t)
 
     # Remove LaTeX math delimiters and keep content: $φ$ -> φ
-    t_str = re.sub(r'\$([^$]*)\$', r'\1', t_str)
+    if "$" in t_str:
+        t_str = _LATEX_MATH_RE.sub(r'\1', t_str)
 
-    # Remove LaTeX commands and keep content: \textbf{text} -> text
-    t_str = re.sub(r'\\[a-zA-Z]+\{([^}]*)}', r'\1', t_str)
+    if "\\" in t_str:
+        # Remove LaTeX commands and keep content: \textbf{text} -> text
+        t_str = _LATEX_CMD_BRACE_RE.sub(r'\1', t_str)
 
-    # Remove remaining backslashes (for commands without braces)
-    t_str = re.sub(r'\\[a-zA-Z]+', '', t_str)
+        # Remove remaining backslashes (for commands without braces)
+        t_str = _LATEX_CMD_RE.sub('', t_str)
 
     # Standard normalization
-    t2 = strip_accents(t_str).lower()
-    for ch in ",.;:!?\n\t\r''""'\"-()[]{}":
-        t2 = t2.replace(ch, " ")
+    t2 = strip_accents(t_str).lower().translate(_PUNCT_TABLE)
     return " ".join(t2.split())
 
 
@@ -172,15 +219,7 @@ def has_placeholder(s: Optional[str]) -> bool:
     s2 = str(s).strip()
     if not s2:
         return True
-    low = s2.lower()
-    if "..." in s2 or "…" in s2:
-        return True
-    if "et al" in low:
-        return True
-    for bad in ("n/a", "tbd", "unknown", "placeholder"):
-        if bad in low:
-            return True
-    return False
+    return _PLACEHOLDER_RE.search(s2.lower()) is not None
 
 
 def normalize_person_name(n: Optional[Any]) -> str:
@@ -190,36 +229,70 @@ def normalize_person_name(n: Optional[Any]) -> str:
     """
     if not n:
         return ""
-    n_str = to_text(n)
+    return _normalize_person_name_str(to_text(n))
+
+
+@lru_cache(maxsize=65536)
+def _normalize_person_name_str(n_str: str) -> str:
+    """
+    Cached core of normalize_person_name; the same author names recur across
+    many publications, so most lookups are cache hits.
+    """
     n2 = strip_accents(n_str).lower()
-    n2 = re.sub(r"[^a-z0-9\s]", " ", n2)
+    n2 = _NON_ALNUM_SPACE_RE.sub(" ", n2)
     return " ".join(n2.split())
 
 
+class _Sig(NamedTuple):
+    """
+    Normalized last name and initials of a person, as produced by name_signature.
+    """
+    last: str
+    initials: str
+
+
 def name_signature(n: Optional[Any]) -> Optional[Dict[str, Any]]:
     """
     Derive a compact signature for a person name that keeps the normalized last
     name and initials, working with both "Last, First" and "First Last" formats.
     """
+    sig = _name_signature_tuple(n)
+    if sig is None:
+        return None
+    return sig._asdict()
+
+
+def _name_signature_tuple(n: Optional[Any]) -> Optional[_Sig]:
+    """
+    Tuple form of name_signature used by the matching helpers in this module.
+    """
     if not n:
         return None
-    n_clean = normalize_person_name(n)
+    return _name_signature_str(to_text(n))
+
+
+@lru_cache(maxsize=65536)
+def _name_signature_str(n_str: str) -> Optional[_Sig]:
+    """
+    Cached core of name_signature returning an immutable signature.
+    """
+    n_clean = _normalize_person_name_str(n_str)
     if not n_clean:
         return None
-    if "," in to_text(n):
-        parts = [p.strip() for p in to_text(n).split(",")]
+    if "," in n_str:
+        parts = [p.strip() for p in n_str.split(",")]
         last = parts[0]
         rest = parts[1] if len(parts) > 1 else ""
-        rest_tokens = [t for t in normalize_person_name(rest).split() if t]
+        rest_tokens = [t for t in _normalize_person_name_str(rest).split() if t]
         initials = "".join(t[0] for t in rest_tokens if t)
-        last_norm = re.sub(r"[^a-z0-9]", "", normalize_person_name(last))
-        return {"last": last_norm, "initials": initials}
+        last_norm = _NON_ALNUM_RE.sub("", _normalize_person_name_str(last))
+        return _Sig(last_norm, initials)
     tokens = n_clean.split()
     if not tokens:
         return None
     last_norm = tokens[-1]
     initials = "".join(t[0] for t in tokens[:-1] if t)
-    return {"last": last_norm, "initials": initials}
+    return _Sig(last_norm, initials)
 
 
 def extract_last_name(full_name: Optional[str]) -> str:
@@ -261,7 +334,7 @@ def format_author_dirname(author_name: Optional[str], author_id: str) -> str:
 
     # Sanitize author_id by replacing reserved path characters with dashes
     # Reserved characters: / \ : * ? " < > |
-    sanitized_id = re.sub(r'[/\\:*?"<>|]+', '-', author_id)
+    sanitized_id = _PATH_RESERVED_RE.sub('-', author_id)
 
     if not sanitized_id:
         if last_name and last_name != "Unknown":
@@ -285,19 +358,20 @@ def parse_authors_any(authors: Any) -> List[str]:
     return extract_authors_from_any(authors)
 
 
-def title_similarity(a: Optional[str], b: Optional[str]) -> float:
+def title_similarity(a: Optional[str], b: Optional[str], score_cutoff: float = 0.0) -> float:
     """
     Compute a similarity score between two titles after normalization, returning
     a value between 0 and 1 where higher means more similar.
 
     Uses rapidfuzz for ~10-100x faster fuzzy matching than difflib.SequenceMatcher.
+    Scores below score_cutoff are reported as 0, which lets rapidfuzz stop early.
     """
     norm_a = normalize_title(a or "")
     norm_b = normalize_title(b or "")
     if norm_a == norm_b:
         return 1.0
     # rapidfuzz.fuzz.ratio returns 0-100, normalize to 0-1
-    return fuzz_ratio(norm_a, norm_b) / 100.0
+    return fuzz_ratio(norm_a, norm_b, score_cutoff=score_cutoff * 100.0) / 100.0
 
 
 def authors_overlap(authors_a: Optional[str], authors_b: Optional[str]) -> bool:
@@ -309,18 +383,20 @@ def authors_overlap(authors_a: Optional[str], authors_b: Optional[str]) -> bool:
     names_b = parse_authors_any(authors_b or "")
     if not names_a or not names_b:
         return False
-    sigs_a = [name_signature(nm) for nm in names_a]
-    sigs_b = [name_signature(nm) for nm in names_b]
-    for sa in sigs_a:
-        if not sa or not sa.get("last"):
+    # bucket one side by last name so each name on the other side is a single lookup
+    initials_by_last: Dict[str, List[str]] = {}
+    for nm in names_b:
+        sb = _name_signature_tuple(nm)
+        if sb and sb.last:
+            initials_by_last.setdefault(sb.last, []).append(sb.initials)
+    if not initials_by_last:
+        return False
+    for nm in names_a:
+        sa = _name_signature_tuple(nm)
+        if not sa or not sa.last:
             continue
-        for sb in sigs_b:
-            if not sb or not sb.get("last"):
-                continue
-            if sa["last"] != sb["last"]:
-                continue
-            ia = sa.get("initials", "")
-            ib = sb.get("initials", "")
+        ia = sa.initials
+        for ib in initials_by_last.get(sa.last, ()):
             if not ia or not ib or ia == ib or ia.startswith(ib) or ib.startswith(ia):
                 return True
     return False
@@ -333,20 +409,23 @@ def author_name_matches(target_author: Optional[str], authors: Any) -> bool:
     """
     if not target_author:
         return False
-    target_sig = name_signature(target_author)
-    if not target_sig or not target_sig.get("last"):
+    target_sig = _name_signature_tuple(target_author)
+    if not target_sig or not target_sig.last:
         return False
+    # identical or case-only variants need no parsing
+    if isinstance(authors, str) and (authors == target_author or authors.casefold() == target_author.casefold()):
+        return True
     cand_names = parse_authors_any(authors)
     if not cand_names:
         return False
     for nm in cand_names:
-        sig = name_signature(nm)
+        sig = _name_signature_tuple(nm)
         if not sig:
             continue
-        if sig["last"] != target_sig["last"]:
+        if sig.last != target_sig.last:
             continue
-        ti = target_sig.get("initials", "")
-        ci = sig.get("initials", "")
+        ti = target_sig.initials
+        ci = sig.initials
         if not ti or not ci:
             return True
         if ti == ci or ti.startswith(ci) or ci.startswith(ti):
@@ -364,14 +443,15 @@ def author_in_text(target_author: Optional[str], text: Any) -> bool:
     """
     if not target_author or not text:
         return False
-    last = name_signature(target_author)
+    last = _name_signature_tuple(target_author)
     if not last:
         return False
-    last_tok = last.get("last") or ""
+    last_tok = last.last
     if not last_tok:
         return False
-    txt = normalize_person_name(to_text(text))
-    return re.search(rf"\b{re.escape(last_tok)}\b", txt) is not None
+    # normalized text is lowercase alphanumeric tokens separated by single spaces,
+    # so a whole-word match is plain token membership
+    return last_tok in normalize_person_name(to_text(text)).split()
 
 
 def extract_year_from_any(
@@ -392,7 +472,11 @@ def extract_year_from_any(
 
     # string with a year somewhere in it
     if isinstance(obj, str):
-        m = re.search(r"(19|20)\d{2}", obj)
+        # already-clean "2024" style values need no regex
+        if len(obj) == 4 and obj.isascii() and obj.isdigit():
+            year = int(obj)
+            return year if VALID_YEAR_MIN <= year <= VALID_YEAR_MAX else fallback
+        m = _YEAR_RE.search(obj)
         if m:
             try:
                 year = int(m.group(0))
@@ -437,8 +521,7 @@ def extract_year_from_any(
             ms = obj.get(fname)
             if isinstance(ms, (int, float)):
                 try:
-                    from datetime import datetime, timezone
-                    year = datetime.fromtimestamp(float(ms) / 1000.0, timezone.utc).year
+                    year = time.gmtime(float(ms) / 1000.0).tm_year
                     if VALID_YEAR_MIN <= year <= VALID_YEAR_MAX:
                         return year
                 except (*NUMERIC_ERRORS, OSError):
@@ -451,6 +534,16 @@ def extract_year_from_any(
     return fallback
 
 
+@lru_cache(maxsize=None)
+def _dblp_sanitizer():
+    """
+    Resolve the DBLP name sanitizer once; it lives in api_clients, which imports
+    this module, so it cannot be imported at module load.
+    """
+    from .api_clients import _sanitize_dblp_author
+    return _sanitize_dblp_author
+
+
 def extract_authors_from_any(
         obj: Any,
         field_names: Optional[List[str]] = None,
@@ -468,6 +561,8 @@ def extract_authors_from_any(
     if obj is None:
         return authors
 
+    sanitize = _dblp_sanitizer() if sanitize_dblp else None
+
     # dict - look for author fields
     if isinstance(obj, dict):
         # try custom field names if provided
@@ -498,15 +593,14 @@ def extract_authors_from_any(
             # Use specified keys (e.g., Crossref style)
             given = (obj.get(given_key) or "").strip()
             family = (obj.get(family_key) or "").strip()
-            nm = f"{given} {family}".strip() if (given or family) else ""
+            nm = _join_name(given, family)
         else:
             # Auto-detect common patterns
             nm = _name_from_dict(obj)
 
         if nm:
-            if sanitize_dblp:
-                from .api_clients import _sanitize_dblp_author
-                nm = _sanitize_dblp_author(nm)
+            if sanitize:
+                nm = sanitize(nm)
             if nm:
                 authors.append(nm)
         return authors
@@ -517,9 +611,8 @@ def extract_authors_from_any(
             if isinstance(item, str):
                 nm = item.strip()
                 if nm:
-                    if sanitize_dblp:
-                        from .api_clients import _sanitize_dblp_author
-                        nm = _sanitize_dblp_author(nm)
+                    if sanitize:
+                        nm = sanitize(nm)
                     if nm:
                         authors.append(nm)
             elif isinstance(item, dict):
@@ -527,19 +620,18 @@ def extract_authors_from_any(
                 if given_key and family_key:
                     given = (item.get(given_key) or "").strip()
                     family = (item.get(family_key) or "").strip()
-                    nm = f"{given} {family}".strip() if (given or family) else ""
+                    nm = _join_name(given, family)
                 else:
                     # Try name key first, then auto-detect given/family
                     nm = (item.get(name_key) or "").strip()
                     if not nm:
                         given = (item.get("given") or item.get("first") or "").strip()
                         family = (item.get("family") or item.get("last") or "").strip()
-                        nm = f"{given} {family}".strip() if (given or family) else ""
+                        nm = _join_name(given, family)
 
                 if nm:
-                    if sanitize_dblp:
-                        from .api_clients import _sanitize_dblp_author
-                        nm = _sanitize_dblp_author(nm)
+                    if sanitize:
+                        nm = sanitize(nm)
                     if nm:
                         authors.append(nm)
             else:
@@ -588,10 +680,8 @@ def extract_authors_from_any(
                     # Pattern: 1-3 capital letters (with optional periods) + SPACE + surname
                     # Examples: "H Huang", "DV Arnold", "H. Huang", "D.V. Arnold", "JK Rowling"
                     # Non-examples: "Smith" (no space), "John" (no initials)
-                    import re
                     # Pattern requires: initials (1-3 caps with optional periods) + mandatory space + surname
-                    abbreviated_pattern = re.compile(r'^[A-Z]\.?\s*[A-Z]?\.?\s*[A-Z]?\.?\s+[A-Z][a-z]+', re.IGNORECASE)
-                    if all(abbreviated_pattern.match(p) for p in parts):
+                    if all(_ABBREV_NAME_RE.match(p) for p in parts):
                         # Both parts look like abbreviated names - treat as list
                         authors = parts
                     elif all(" " in p.strip() for p in parts):
@@ -681,10 +771,21 @@ def filter_valid_fields(
     Remove keys whose values are empty, None, or placeholder-like so the
     remaining dictionary contains only useful metadata fields.
     """
-    return {
-        k: v for k, v in fields.items()
-        if is_valid_value(v, check_placeholder=check_placeholder)
-    }
+    # same rules as is_valid_value, inlined since this runs on every field of every entry
+    valid: Dict[str, Any] = {}
+    for k, v in fields.items():
+        if v is None:
+            continue
+        if isinstance(v, str):
+            s = v.strip()
+            if not s:
+                continue
+            if check_placeholder and _PLACEHOLDER_RE.search(s.lower()) is not None:
+                continue
+        elif isinstance(v, (list, dict)) and not v:
+            continue
+        valid[k] = v
+    return valid
 
 
 def is_truncated(text: Optional[str]) -> bool:
@@ -694,24 +795,9 @@ def is_truncated(text: Optional[str]) -> bool:
     if not text or not isinstance(text, str):
         return False
 
-    text_stripped = text.strip()
-
-    # Check for explicit truncation markers
-    truncation_markers = [
-        "...",
-        "…",
-        "et al",
-        "et al.",
-        "[truncated]",
-        "[...]",
-    ]
-
-    text_lower = text_stripped.lower()
-    for marker in truncation_markers:
-        if marker in text_lower:
-            return True
-
-    return False
+    # Check for explicit truncation markers ("...", "…", "et al", "[truncated]";
+    # "et al." and "[...]" are covered by the shorter markers)
+    return _TRUNCATION_RE.search(text.strip().lower()) is not None
 
 
 def get_truncation_score(article_data: Dict[str, Any]) -> float:
@@ -809,6 +895,7 @@ def safe_get_nested(obj: Any, *keys: str, default=None) -> Any:
     """
     current = obj
     for key in keys:
+        # only dicts are walked; lists, strings and other subscriptables count as missing
         if not isinstance(current, dict):
             return default
         current = current.get(key)
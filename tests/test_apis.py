@@ -1,94 +1,163 @@
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pytest
+
+# CITEFORGE_SKIP_APIS=1 skips this network-bound module before the API clients are imported
+if os.environ.get("CITEFORGE_SKIP_APIS"):
+    pytest.skip("CITEFORGE_SKIP_APIS is set", allow_module_level=True)
+
 from src import api_clients, api_generics, bibtex_utils, api_configs, doi_utils
+from src.exceptions import RateLimitedError
 from tests.fixtures import load_api_keys
 from tests.test_data import KNOWN_PAPERS, API_SPECIFIC_PAPERS
 
+# Module symbol tables for the introspection tests
+_API_CLIENTS_SYMBOLS = vars(api_clients)
+_API_CONFIGS_SYMBOLS = vars(api_configs)
+_DOI_UTILS_SYMBOLS = vars(doi_utils)
+
+_REQUIRED_MULTI = frozenset({
+    'crossref_search_multiple',
+    'openalex_search_multiple',
+    's2_search_papers_multiple',
+    'pubmed_search_papers_multiple',
+    'europepmc_search_papers_multiple',
+    'openreview_search_papers_multiple',
+})
+
+# Query papers used by the search tests, resolved once
+_CR_TITLE, _CR_AUTHOR = KNOWN_PAPERS[0]['title'], KNOWN_PAPERS[0]['first_author']
+_OA_TITLE, _OA_AUTHOR = API_SPECIFIC_PAPERS['openalex']['title'], API_SPECIFIC_PAPERS['openalex']['first_author']
+_S2_TITLE, _S2_AUTHOR = (
+    API_SPECIFIC_PAPERS['semantic_scholar']['title'],
+    API_SPECIFIC_PAPERS['semantic_scholar']['first_author'],
+)
+
+# Geoffrey Hinton's Scholar ID
+SCHOLAR_AUTHOR_ID = "JicYPdAAAAAJ"
+
 @pytest.fixture(scope="module")
 def api_keys():
     return load_api_keys()
 
-# ===== SERPAPI (GOOGLE SCHOLAR) =====
-
-def test_serpapi_connection(api_keys):
+@pytest.fixture(scope="module")
+def author_publications(api_keys):
     """
-    Test SerpAPI connection and publication fetching.
+    Fetch the test author's publications once and share them between the SerpAPI tests.
     """
     if not api_keys.get('serpapi'):
         pytest.skip("SerpAPI key not available")
 
-    # Use Geoffrey Hinton's Scholar ID
-    author_id = "JicYPdAAAAAJ"
-    data = api_clients.fetch_author_publications(api_keys['serpapi'], author_id)
+    try:
+        return api_clients.fetch_author_publications(api_keys['serpapi'], SCHOLAR_AUTHOR_ID)
+    except RateLimitedError as e:
+        pytest.skip(f"Rate limited (retry_after={e.retry_after})")
 
-    articles = data.get('articles', [])
-    assert articles and len(articles) > 0, "No publications returned"
+@pytest.fixture(scope="module")
+def prefetched_searches(api_keys):
+    """
+    Start the Crossref, OpenAlex and (when keyed) Semantic Scholar searches together
+    so their network waits overlap; each test reads its own future so failures stay per-test.
+    Every host gets a single worker, so no host sees more than one request at a time.
+    """
+    crossref_pool = ThreadPoolExecutor(max_workers=1)
+    openalex_pool = ThreadPoolExecutor(max_workers=1)
+    s2_pool = ThreadPoolExecutor(max_workers=1)
+    with crossref_pool, openalex_pool, s2_pool:
+        futures = {
+            'crossref': crossref_pool.submit(
+                api_clients.crossref_search, _CR_TITLE, _CR_AUTHOR
+            ),
+            'crossref_multiple': crossref_pool.submit(
+                api_clients.crossref_search_multiple, _CR_TITLE, _CR_AUTHOR, max_results=5
+            ),
+            'openalex': openalex_pool.submit(
+                api_clients.openalex_search_paper, _OA_TITLE, _OA_AUTHOR
+            ),
+        }
+        if api_keys.get('semantic'):
+            futures['s2_multiple'] = s2_pool.submit(
+                api_clients.s2_search_papers_multiple,
+                _S2_TITLE, _S2_AUTHOR, api_keys['semantic'], max_results=5
+            )
+    return futures
 
-def test_serpapi_scholar_citation(api_keys):
+@pytest.fixture(scope="module")
+def crossref_bibtex(prefetched_searches):
     """
-    Test SerpAPI Scholar citation fetch via API.
+    Build the BibTeX for the prefetched Crossref item once for every test that checks it.
     """
-    if not api_keys.get('serpapi'):
-        pytest.skip("SerpAPI key not available")
+    item = prefetched_searches['crossref'].result()
+    if not item:
+        return None
+    return api_clients.build_bibtex_from_crossref(item, _CR_AUTHOR)
 
-    try:
-        # Fetch publications to get a real citation_id
-        author_id = "JicYPdAAAAAJ"
-        data = api_clients.fetch_author_publications(api_keys['serpapi'], author_id)
+# ===== SERPAPI (GOOGLE SCHOLAR) =====
+
+@pytest.mark.network
+def test_serpapi_connection(author_publications):
+    """
+    Test SerpAPI connection and publication fetching.
+    """
+    articles = author_publications.get('articles', [])
+    assert articles and len(articles) > 0, "No publications returned"
 
-        articles = data.get('articles', [])
-        assert articles, "No articles to test citation fetch"
+@pytest.mark.network
+def test_serpapi_scholar_citation(api_keys, author_publications):
+    """
+    Test SerpAPI Scholar citation fetch via API.
+    """
+    # Use the shared publication list to get a real citation_id
+    articles = author_publications.get('articles', [])
+    assert articles, "No articles to test citation fetch"
 
-        citation_id = articles[0].get('citation_id')
-        assert citation_id, "No citation_id found"
+    citation_id = articles[0].get('citation_id')
+    assert citation_id, "No citation_id found"
 
-        # Test SerpAPI citation function
+    # Test SerpAPI citation function
+    try:
         fields = api_clients.fetch_scholar_citation_via_serpapi(
             api_keys['serpapi'],
-            author_id,
+            SCHOLAR_AUTHOR_ID,
             citation_id
         )
+    except RateLimitedError as e:
+        pytest.skip(f"Rate limited (retry_after={e.retry_after})")
 
-        assert fields and 'title' in fields, "No valid fields returned from SerpAPI citation"
-
-        # Build BibTeX from fields
-        bibtex = api_clients.build_bibtex_from_scholar_fields(fields, keyhint="test")
-        assert bibtex and '@' in bibtex, "BibTeX building from citation fields failed"
+    assert fields and 'title' in fields, "No valid fields returned from SerpAPI citation"
 
-    except Exception as e:
-        error_msg = str(e)
-        if '429' in error_msg:
-            pytest.skip("Rate limited (expected with frequent requests)")
-        else:
-            raise e
+    # Build BibTeX from fields
+    bibtex = api_clients.build_bibtex_from_scholar_fields(fields, keyhint="test")
+    assert bibtex and '@' in bibtex, "BibTeX building from citation fields failed"
 
 # ===== SINGLE-RESULT SEARCHES =====
 
-def test_crossref_search():
+@pytest.mark.network
+def test_crossref_search(prefetched_searches, crossref_bibtex):
     """
     Test Crossref API search and BibTeX building.
     """
-    paper = KNOWN_PAPERS[0]
-    item = api_clients.crossref_search(paper['title'], paper['first_author'])
+    item = prefetched_searches['crossref'].result()
 
     if item:
-        bibtex = api_clients.build_bibtex_from_crossref(item, paper['first_author'])
+        bibtex = crossref_bibtex
         parsed = bibtex_utils.parse_bibtex_to_dict(bibtex)
 
         assert parsed and 'type' in parsed, "BibTeX building failed"
     else:
         pytest.skip("No result (API may be unavailable)")
 
-def test_openalex_search():
+@pytest.mark.network
+def test_openalex_search(prefetched_searches):
     """
     Test OpenAlex API search and BibTeX building.
     """
-    paper = API_SPECIFIC_PAPERS['openalex']
-    work = api_clients.openalex_search_paper(paper['title'], paper['first_author'])
+    work = prefetched_searches['openalex'].result()
 
     if work:
-        bibtex = api_clients.build_bibtex_from_openalex(work, paper['first_author'])
+        bibtex = api_clients.build_bibtex_from_openalex(work, _OA_AUTHOR)
         parsed = bibtex_utils.parse_bibtex_to_dict(bibtex)
 
         assert parsed and 'type' in parsed, "BibTeX building failed"
@@ -101,46 +170,30 @@ def test_all_multiple_candidate_functions_exist():
     """
     Test that all multiple-candidate wrapper functions exist.
     """
-    required_functions = [
-        'crossref_search_multiple',
-        'openalex_search_multiple',
-        's2_search_papers_multiple',
-        'pubmed_search_papers_multiple',
-        'europepmc_search_papers_multiple',
-        'openreview_search_papers_multiple',
-    ]
-
-    for func_name in required_functions:
-        assert hasattr(api_clients, func_name), f"Function {func_name} not found"
-        assert callable(getattr(api_clients, func_name)), f"Function {func_name} is not callable"
-
-def test_crossref_multiple_candidates():
+    present = _REQUIRED_MULTI & _API_CLIENTS_SYMBOLS.keys()
+    missing = _REQUIRED_MULTI - present
+    non_callable = {name for name in present if not callable(_API_CLIENTS_SYMBOLS[name])}
+    assert not missing, f"Functions not found: {', '.join(sorted(missing))}"
+    assert not non_callable, f"Functions not callable: {', '.join(sorted(non_callable))}"
+
+@pytest.mark.network
+def test_crossref_multiple_candidates(prefetched_searches):
     """
     Test Crossref multiple-candidate search.
     """
-    paper = KNOWN_PAPERS[0]
-    candidates = api_clients.crossref_search_multiple(
-        paper['title'],
-        paper['first_author'],
-        max_results=5
-    )
+    candidates = prefetched_searches['crossref_multiple'].result()
 
     assert isinstance(candidates, list), f"Expected list, got {type(candidates).__name__}"
 
-def test_s2_multiple_candidates(api_keys):
+@pytest.mark.network
+def test_s2_multiple_candidates(prefetched_searches):
     """
     Test Semantic Scholar multiple-candidate search.
     """
-    if not api_keys.get('semantic'):
+    if 's2_multiple' not in prefetched_searches:
         pytest.skip("Semantic Scholar key not available")
 
-    paper = API_SPECIFIC_PAPERS['semantic_scholar']
-    candidates = api_clients.s2_search_papers_multiple(
-        paper['title'],
-        paper['first_author'],
-        api_keys['semantic'],
-        max_results=5
-    )
+    candidates = prefetched_searches['s2_multiple'].result()
 
     assert isinstance(candidates, list), f"Expected list, got {type(candidates).__name__}"
 
@@ -169,9 +222,10 @@ def test_api_configs():
     Test API configuration objects.
     """
     configs = ['S2_SEARCH_CONFIG', 'CROSSREF_SEARCH_CONFIG', 'OPENALEX_SEARCH_CONFIG']
+    missing = [name for name in configs if name not in _API_CONFIGS_SYMBOLS]
+    assert not missing, f"Missing: {', '.join(missing)}"
     for name in configs:
-        assert hasattr(api_configs, name), f"Missing: {name}"
-        cfg = getattr(api_configs, name)
+        cfg = _API_CONFIGS_SYMBOLS[name]
         assert isinstance(cfg, api_generics.APISearchConfig), f"{name} wrong type"
         assert cfg.api_name and cfg.base_url, f"{name} incomplete"
 
@@ -180,9 +234,10 @@ def test_api_field_mappings():
     Test API field mapping objects.
     """
     mappings = ['S2_FIELD_MAPPING', 'CROSSREF_FIELD_MAPPING', 'OPENALEX_FIELD_MAPPING']
+    missing = [name for name in mappings if name not in _API_CONFIGS_SYMBOLS]
+    assert not missing, f"Missing: {', '.join(missing)}"
     for name in mappings:
-        assert hasattr(api_configs, name), f"Missing: {name}"
-        mapping = getattr(api_configs, name)
+        mapping = _API_CONFIGS_SYMBOLS[name]
         assert isinstance(mapping, api_generics.APIFieldMapping), f"{name} wrong type"
         assert mapping.title_fields and mapping.author_fields, f"{name} incomplete"
 
@@ -190,22 +245,20 @@ def test_doi_validation_functions():
     """
     Test DOI validation utilities.
     """
-    assert hasattr(doi_utils, 'validate_doi_candidate'), "Missing validate_doi_candidate"
-    assert callable(doi_utils.validate_doi_candidate), "validate_doi_candidate not callable"
-
-    assert hasattr(doi_utils, 'process_validated_doi'), "Missing process_validated_doi"
-    assert callable(doi_utils.process_validated_doi), "process_validated_doi not callable"
+    for name in ('validate_doi_candidate', 'process_validated_doi'):
+        assert name in _DOI_UTILS_SYMBOLS, f"Missing {name}"
+        assert callable(_DOI_UTILS_SYMBOLS[name]), f"{name} not callable"
 
 # ===== INTEGRATION =====
 
-def test_bibtex_building_from_api_responses():
+@pytest.mark.network
+def test_bibtex_building_from_api_responses(prefetched_searches, crossref_bibtex):
     """
     Test BibTeX building from all API response types.
     """
-    paper = KNOWN_PAPERS[0]
-
-    # Test Crossref
-    cr_item = api_clients.crossref_search(paper['title'], paper['first_author'])
+    # Test Crossref (same query as test_crossref_search, so reuse its result)
+    cr_item = prefetched_searches['crossref'].result()
     if cr_item:
-        bibtex = api_clients.build_bibtex_from_crossref(cr_item, paper['first_author'])
+        bibtex = crossref_bibtex
         assert bibtex and '@' in bibtex, "Crossref BibTeX building failed"
+        assert bibtex_utils.parse_bibtex_to_dict(bibtex), "Crossref BibTeX could not be parsed"
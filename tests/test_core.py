@@ -2,151 +2,154 @@ import os
 import sys
 from pathlib import Path
 from textwrap import dedent
+from unittest.mock import MagicMock, patch
 import pytest
+import requests
 from src import text_utils, id_utils, config, bibtex_utils as bt, io_utils, merge_utils
-from src import exceptions, http_utils
+from src import exceptions, http_utils, api_clients
 from src.models import Record
 
 # ===== TEXT NORMALIZATION =====
 
+_TITLE_NORM_CASES = (
+    # Basic
+    ("Attention Is All You Need", "attention is all you need"),
+    ("Deep Residual Learning for Image Recognition", "deep residual learning for image recognition"),
+    ("BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding", "bert pre training of deep bidirectional transformers for language understanding"),
+    ("Title   Spaces", "title spaces"),
+    # LaTeX
+    ("Analysis of $\\phi$ distribution", "analysis of distribution"),
+    ("\\textbf{Bold Title}", "bold title"),
+    ("\\emph{Text} here", "text here"),
+    # Accents
+    ("Café Society", "cafe society"),
+    ("Naïve Bayes", "naive bayes"),
+    # Complex/Edge Cases
+    ("On the $\\sqrt{2}$ approximation", "on the 2 approximation"),
+    ("A very long title that goes on and on", "a very long title that goes on and on"),
+    # Empty
+    ("", ""),
+    (None, ""),
+)
+
 def test_title_normalization():
     """
     Test title normalization with all variations.
     """
-    test_cases = [
-        # Basic
-        ("Attention Is All You Need", "attention is all you need"),
-        ("Deep Residual Learning for Image Recognition", "deep residual learning for image recognition"),
-        ("BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding", "bert pre training of deep bidirectional transformers for language understanding"),
-        ("Title   Spaces", "title spaces"),
-        # LaTeX
-        ("Analysis of $\\phi$ distribution", "analysis of distribution"),
-        ("\\textbf{Bold Title}", "bold title"),
-        ("\\emph{Text} here", "text here"),
-        # Accents
-        ("Café Society", "cafe society"),
-        ("Naïve Bayes", "naive bayes"),
-        # Complex/Edge Cases
-        ("On the $\\sqrt{2}$ approximation", "on the 2 approximation"),
-        ("A very long title that goes on and on", "a very long title that goes on and on"),
-        # Empty
-        ("", ""),
-        (None, ""),
-    ]
-
-    for input_val, expected in test_cases:
-        output = text_utils.normalize_title(input_val)
+    normalize = text_utils.normalize_title
+    for input_val, expected in _TITLE_NORM_CASES:
+        output = normalize(input_val)
         assert output == expected, f"Expected '{expected}', got '{output}'"
 
+_TITLE_SIM_CASES = (
+    ("Attention Is All You Need", "Attention Is All You Need", True),
+    ("Attention Is All You Need", "attention is all you need", True),
+    ("Deep Learning", "Machine Learning", False),
+)
+
 def test_title_similarity():
     """
     Test title similarity scoring.
     """
-    test_cases = [
-        ("Attention Is All You Need", "Attention Is All You Need", True),
-        ("Attention Is All You Need", "attention is all you need", True),
-        ("Deep Learning", "Machine Learning", False),
-    ]
-
-    for title1, title2, should_be_similar in test_cases:
-        score = text_utils.title_similarity(title1, title2)
+    similarity = text_utils.title_similarity
+    for title1, title2, should_be_similar in _TITLE_SIM_CASES:
+        score = similarity(title1, title2)
         is_similar = score >= 0.8
         assert is_similar == should_be_similar, f"Expected similarity {should_be_similar}, got score {score}"
 
 # ===== AUTHOR PARSING =====
 
+_AUTHOR_PARSE_CASES = (
+    ("Ashish Vaswani and Noam Shazeer", ["Ashish Vaswani", "Noam Shazeer"]),
+    ("Kaiming He; Xiangyu Zhang", ["Kaiming He", "Xiangyu Zhang"]),
+    ("J Devlin, M Chang", ["J Devlin", "M Chang"]),
+    ("Vaswani, Ashish", ["Vaswani, Ashish"]),
+    ("Hinton, LeCun, Bengio", ["Hinton", "LeCun", "Bengio"]),
+    # Complex/Edge Cases
+    ("Jürgen Müller; François Dubois", ["Jürgen Müller", "François Dubois"]),
+    ("Georges Aad et al.", ["Georges Aad", "et al."]),
+    ("", []),
+    (None, []),
+)
+
 def test_author_parsing():
     """
     Test author parsing with all formats.
     """
-    test_cases = [
-        ("Ashish Vaswani and Noam Shazeer", ["Ashish Vaswani", "Noam Shazeer"]),
-        ("Kaiming He; Xiangyu Zhang", ["Kaiming He", "Xiangyu Zhang"]),
-        ("J Devlin, M Chang", ["J Devlin", "M Chang"]),
-        ("Vaswani, Ashish", ["Vaswani, Ashish"]),
-        ("Hinton, LeCun, Bengio", ["Hinton", "LeCun", "Bengio"]),
-        # Complex/Edge Cases
-        ("Jürgen Müller; François Dubois", ["Jürgen Müller", "François Dubois"]),
-        ("Georges Aad et al.", ["Georges Aad", "et al."]),
-        ("", []),
-        (None, []),
-    ]
-
-    for input_val, expected in test_cases:
-        output = text_utils.extract_authors_from_any(input_val)
+    extract = text_utils.extract_authors_from_any
+    for input_val, expected in _AUTHOR_PARSE_CASES:
+        output = extract(input_val)
         assert output == expected, f"Expected {expected}, got {output}"
 
+_AUTHOR_MATCH_CASES = (
+    ("Ashish Vaswani", "Ashish Vaswani", True),
+    ("ASHISH VASWANI", "ashish vaswani", True),
+    ("Geoffrey Hinton", "G Hinton", True),
+    ("Kaiming He", "K He", True),
+    ("Ashish Vaswani", "A Vaswani", True),
+    ("Ashish Vaswani", "Noam Shazeer", False),
+    ("A Vaswani", "B Vaswani", False),
+)
+
 def test_author_matching():
     """
     Test author name matching with initials.
     """
-    test_cases = [
-        ("Ashish Vaswani", "Ashish Vaswani", True),
-        ("ASHISH VASWANI", "ashish vaswani", True),
-        ("Geoffrey Hinton", "G Hinton", True),
-        ("Kaiming He", "K He", True),
-        ("Ashish Vaswani", "A Vaswani", True),
-        ("Ashish Vaswani", "Noam Shazeer", False),
-        ("A Vaswani", "B Vaswani", False),
-    ]
-
-    for name1, name2, should_match in test_cases:
-        matches = text_utils.author_name_matches(name1, name2)
+    matches_fn = text_utils.author_name_matches
+    for name1, name2, should_match in _AUTHOR_MATCH_CASES:
+        matches = matches_fn(name1, name2)
         assert matches == should_match, f"Expected match {should_match} for '{name1}' vs '{name2}'"
 
+_AUTHORS_OVERLAP_CASES = (
+    ("Ashish Vaswani and Noam Shazeer", "Ashish Vaswani", True),
+    ("Hinton; LeCun; Bengio", "LeCun", True),
+    ("Ashish Vaswani", "Noam Shazeer", False),
+    ("", "", False),
+)
+
 def test_authors_overlap():
     """
     Test author list overlap detection.
     """
-    test_cases = [
-        ("Ashish Vaswani and Noam Shazeer", "Ashish Vaswani", True),
-        ("Hinton; LeCun; Bengio", "LeCun", True),
-        ("Ashish Vaswani", "Noam Shazeer", False),
-        ("", "", False),
-    ]
-
-    for authors1, authors2, should_overlap in test_cases:
-        overlap = text_utils.authors_overlap(authors1, authors2)
+    overlaps = text_utils.authors_overlap
+    for authors1, authors2, should_overlap in _AUTHORS_OVERLAP_CASES:
+        overlap = overlaps(authors1, authors2)
         assert overlap == should_overlap, f"Expected overlap {should_overlap} for '{authors1}' vs '{authors2}'"
 
 # ===== ID EXTRACTION =====
 
+# (function under test, input, expected)
+_DOI_CASES = (
+    (id_utils.find_doi_in_text, "https://doi.org/10.18653/v1/N19-1423", "10.18653/v1/n19-1423"),
+    (id_utils.find_doi_in_text, "doi:10.1234/TEST", "10.1234/test"),
+    (id_utils.find_doi_in_html, '<meta name="citation_doi" content="10.18653/v1/N19-1423" />', "10.18653/v1/n19-1423"),
+    (id_utils.normalize_doi, "  10.1234/TEST  ", "10.1234/test"),
+    (id_utils.normalize_doi, "", None),
+    (id_utils.normalize_doi, None, None),
+)
+
 def test_doi_extraction():
     """
     Test DOI extraction and normalization.
     """
-    test_cases = [
-        ("https://doi.org/10.18653/v1/N19-1423", "10.18653/v1/n19-1423"),
-        ("doi:10.1234/TEST", "10.1234/test"),
-        ('<meta name="citation_doi" content="10.18653/v1/N19-1423" />', "10.18653/v1/n19-1423"),
-        ("  10.1234/TEST  ", "10.1234/test"),
-        ("", None),
-        (None, None),
-    ]
-
-    for input_val, expected in test_cases:
-        if input_val and '<meta' in str(input_val):
-            output = id_utils.find_doi_in_html(input_val)
-        elif input_val and 'doi' in input_val:
-            output = id_utils.find_doi_in_text(input_val)
-        else:
-            output = id_utils.normalize_doi(input_val)
-
+    for fn, input_val, expected in _DOI_CASES:
+        output = fn(input_val)
         assert output == expected, f"Expected '{expected}', got '{output}'"
 
+_ARXIV_CASES = (
+    ("See arXiv:1706.03762 for details", "1706.03762"),
+    ("https://arxiv.org/abs/1706.03762v5", "1706.03762"),
+    ("arxiv.org/abs/1706.03762", "1706.03762"),
+    ("", None),
+)
+
 def test_arxiv_extraction():
     """
     Test arXiv ID extraction.
     """
-    test_cases = [
-        ("See arXiv:1706.03762 for details", "1706.03762"),
-        ("https://arxiv.org/abs/1706.03762v5", "1706.03762"),
-        ("arxiv.org/abs/1706.03762", "1706.03762"),
-        ("", None),
-    ]
-
-    for input_val, expected in test_cases:
-        output = id_utils.find_arxiv_in_text(input_val) if input_val else None
+    find_arxiv = id_utils.find_arxiv_in_text
+    for input_val, expected in _ARXIV_CASES:
+        output = find_arxiv(input_val) if input_val else None
         assert output == expected, f"Expected '{expected}', got '{output}'"
 
 # ===== BIBTEX PARSING =====
@@ -179,13 +182,9 @@ def test_bibtex_parsing():
         for key, expected_val in expected_keys.items():
             assert parsed.get(key) == expected_val, f"Expected field '{key}' to be '{expected_val}'"
 
-    # Invalid cases
-    for invalid_bib in ["", "invalid bibtex"]:
-        try:
-            parsed = bt.parse_bibtex_to_dict(invalid_bib)
-            assert parsed is None, "Expected None for invalid BibTeX"
-        except (ValueError, TypeError, KeyError, AttributeError, IndexError):
-            pytest.fail("Should not crash on invalid input")
+    # Invalid cases (any exception surfaces as a test error on its own)
+    for invalid_bib in ("", "invalid bibtex"):
+        assert bt.parse_bibtex_to_dict(invalid_bib) is None, f"Expected None for invalid BibTeX {invalid_bib!r}"
 
 def test_bibtex_building():
     """
@@ -610,7 +609,7 @@ def test_read_records_from_csv(tmp_path):
         ,https://scholar.google.com/citations?user=Scholar789,
         InvalidRow,,
     """).strip()
-    io_utils.safe_write_file(csv_path_str, csv_content)
+    csv_path.write_text(csv_content, encoding="utf-8")
 
     # Read records
     records = io_utils.read_records(csv_path_str)
@@ -716,6 +715,10 @@ def test_merge_doi_arxiv_handling():
     assert not fields.get("eprint"), "eprint should be removed when DOI present"
     assert not fields.get("archiveprefix"), "archiveprefix should be removed when DOI present"
 
+    # non-string identifier values (e.g. a list eprint from CSL-JSON) must not break the memoized lookup
+    listy = {"type": "article", "key": "k", "fields": {"title": "T", "eprint": ["1706.03762"]}}
+    assert merge_utils.merge_with_policy(listy, []).get("fields", {}).get("title") == "T"
+
 def test_save_entry_to_file(tmp_path):
     """
     Test saving BibTeX entry to file with collision handling.
@@ -738,8 +741,9 @@ def test_save_entry_to_file(tmp_path):
     )
 
     assert os.path.exists(path1), f"File not created: {path1}"
+    mtime1 = os.stat(path1).st_mtime_ns
 
-    # Save same entry again (should reuse same file)
+    # Save same entry again (should reuse same file without rewriting it)
     path2 = merge_utils.save_entry_to_file(
         tmpdir_str, "Scholar123", entry,
         prefer_path=path1,
@@ -747,6 +751,7 @@ def test_save_entry_to_file(tmp_path):
     )
 
     assert path1 == path2, f"Should reuse same path: {path1} vs {path2}"
+    assert os.stat(path2).st_mtime_ns == mtime1, "Unchanged entry should not be rewritten"
 
     # Modify entry and save (should create new file or update)
     entry["fields"]["booktitle"] = "NeurIPS"
@@ -780,6 +785,46 @@ def test_http_error_decorator():
     ret = failing_func()
     assert ret == "fallback", f"Expected 'fallback', got '{ret}'"
 
+def _canned_response(status_code, headers=None):
+    """
+    Build a requests.Response with the given status and an empty JSON body.
+    """
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp.headers.update(headers or {})
+    resp.url = "https://serpapi.com/search"
+    resp._content = b"{}"
+    return resp
+
+def test_rate_limit_reaches_serpapi_callers():
+    """
+    Test that an exhausted 429 surfaces as RateLimitedError, with its status and
+    Retry-After, from both SerpAPI fetchers instead of an empty result.
+    """
+    limited = MagicMock(return_value=_canned_response(429, {"Retry-After": "7"}))
+    with patch.object(http_utils._SESSION, "get", limited), patch.object(http_utils.time, "sleep"):
+        with pytest.raises(exceptions.RateLimitedError) as citation_err:
+            api_clients.fetch_scholar_citation_via_serpapi("key", "author", "cite")
+        with pytest.raises(exceptions.RateLimitedError) as publications_err:
+            api_clients.fetch_author_publications("key", "author")
+
+    for err in (citation_err.value, publications_err.value):
+        assert err.status_code == 429, f"Expected status 429, got {err.status_code}"
+        assert err.retry_after == 7.0, f"Expected retry_after 7.0, got {err.retry_after}"
+
+def test_exhausted_server_error_raises_http_error():
+    """
+    Test that a 5xx still failing after retries surfaces as requests' HTTPError
+    from http_fetch_bytes rather than being returned or rate-limit typed.
+    """
+    failing = MagicMock(return_value=_canned_response(500))
+    with patch.object(http_utils._SESSION, "get", failing), patch.object(http_utils.time, "sleep"):
+        with pytest.raises(requests.exceptions.HTTPError) as err:
+            http_utils.http_fetch_bytes("https://serpapi.com/search", {}, timeout=1.0)
+
+    assert not isinstance(err.value, exceptions.RateLimitedError), "5xx must not be reported as rate limiting"
+    assert err.value.response.status_code == 500, f"Expected status 500, got {err.value.response.status_code}"
+
 
 # ===== DATA QUALITY TESTS =====
 
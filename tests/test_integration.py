@@ -18,6 +18,7 @@ from tests.test_data import TEST_AUTHOR, KNOWN_PAPERS, REQUIRED_FIELDS
 def api_keys():
     return load_api_keys()
 
+@pytest.mark.network
 def test_fetch_and_merge(api_keys):
     """
     Validate end-to-end publication fetching from Scholar and DBLP followed
@@ -65,6 +66,7 @@ def test_fetch_and_merge(api_keys):
     # We expect some merging to happen, or at least not to crash
     assert isinstance(merged, list)
 
+@pytest.mark.network
 def test_full_enrichment_pipeline(api_keys):
     """
     Execute the complete enrichment workflow for a known paper.
@@ -268,6 +270,7 @@ def test_csv_summary_integration(tmp_path):
     for i, expected in enumerate(expected_hits):
         assert int(rows[i]['trust_hits']) == expected, f"Row {i}: expected trust_hits={expected}, got {rows[i]['trust_hits']}"
 
+@pytest.mark.network
 def test_complex_paper_enrichment(api_keys):
     """
     Test enrichment pipeline with a complex paper (AlphaFold) that has
@@ -20,7 +20,7 @@ def test_read_records_from_csv(tmp_path):
         ,https://scholar.google.com/citations?user=Scholar789,
         InvalidRow,,
     """).strip()
-    io_utils.safe_write_file(csv_path_str, csv_content)
+    csv_path.write_text(csv_content, encoding="utf-8")
 
     # Read records
     records = io_utils.read_records(csv_path_str)
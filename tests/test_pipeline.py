@@ -1,16 +1,62 @@
 import sys
 from pathlib import Path
 from textwrap import dedent
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import urllib.error
 import pytest
 
 from src import bibtex_utils as bt, api_clients as api
-from src.doi_utils import validate_doi_candidate, process_validated_doi
+from src.doi_utils import DOIFetchers, validate_doi_candidate, process_validated_doi
 from src.exceptions import ALL_API_ERRORS
 
 # ===== DOI VALIDATION PIPELINE TESTS =====
 
+# shared mock data, built once at import; validation only reads these
+_BASELINE_VASWANI = {
+    'type': 'inproceedings',
+    'key': 'Vaswani2017',
+    'fields': {
+        'title': 'Attention Is All You Need',
+        'author': 'Ashish Vaswani',
+        'year': '2017'
+    }
+}
+
+_CSL_VASWANI = {
+    'title': 'Attention Is All You Need',
+    'author': [{'given': 'Ashish', 'family': 'Vaswani'}],
+    'issued': {'date-parts': [[2017]]}
+}
+
+_BIBTEX_VASWANI = dedent("""
+    @inproceedings{Vaswani2017,
+      title = {Attention Is All You Need},
+      author = {Ashish Vaswani and Noam Shazeer},
+      year = {2017}
+    }
+""").strip()
+
+# metadata for a completely different paper (BERT)
+_CSL_BERT = {
+    'title': 'BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding',
+    'author': [{'given': 'Jacob', 'family': 'Devlin'}],
+    'issued': {'date-parts': [[2019]]}
+}
+
+# resolver failures, built once and raised by the network-error mocks
+_URL_ERROR = urllib.error.URLError("Network error")
+_HTTP_500 = urllib.error.HTTPError(url='test', code=500, msg='Server Error', hdrs={}, fp=None)
+
+def _fetchers(csl, bibtex, bibtex_from_csl):
+    """
+    Build injected DOI resolver calls that return canned metadata.
+    """
+    return DOIFetchers(
+        csl=lambda doi: csl,
+        bibtex=lambda doi: bibtex,
+        bibtex_from_csl=lambda csl_data, keyhint=None: bibtex_from_csl,
+    )
+
 def test_validate_doi_candidate_both_formats_match():
     """
     Verify that DOI validation succeeds when both CSL and BibTeX metadata
@@ -38,23 +84,13 @@ def test_validate_doi_candidate_both_formats_match():
         'issued': {'date-parts': [[2017]]}
     }
 
-    # mock BibTeX response that also matches baseline
-    mock_bibtex = dedent("""
-        @inproceedings{Vaswani2017,
-          title = {Attention Is All You Need},
-          author = {Ashish Vaswani and Noam Shazeer},
-          year = {2017}
-        }
-    """).strip()
-    # patch API functions to return matching metadata
-    with patch.object(api, 'fetch_csl_via_doi', return_value=mock_csl):
-        with patch.object(api, 'fetch_bibtex_via_doi', return_value=mock_bibtex):
-            with patch.object(api, 'bibtex_from_csl', return_value=mock_bibtex):
-                csl_matched, bibtex_matched, csl_entry, bibtex_entry = validate_doi_candidate(
-                    doi="10.48550/arXiv.1706.03762",
-                    baseline_entry=baseline_entry,
-                    result_id="test"
-                )
+    # inject resolver calls that return matching metadata (BibTeX also matches baseline)
+    fetchers = _fetchers(mock_csl, _BIBTEX_VASWANI, _BIBTEX_VASWANI)
+    csl_matched, bibtex_matched, csl_entry, bibtex_entry = validate_doi_candidate(
+        doi="10.48550/arXiv.1706.03762",
+        baseline_entry=baseline_entry,
+        result_id="test", fetchers=fetchers
+    )
 
     # both formats should validate successfully
     assert csl_matched and bibtex_matched, "Both formats should have matched"
@@ -75,13 +111,6 @@ def test_validate_doi_candidate_csl_only_matches():
         }
     }
 
-    # CSL matches baseline
-    mock_csl = {
-        'title': 'Attention Is All You Need',
-        'author': [{'given': 'Ashish', 'family': 'Vaswani'}],
-        'issued': {'date-parts': [[2017]]}
-    }
-
     # BibTeX returns wrong paper metadata
     mock_bibtex_wrong = dedent("""
         @inproceedings{Wrong2018,
@@ -90,22 +119,13 @@ def test_validate_doi_candidate_csl_only_matches():
           year = {2018}
         }
     """).strip()
-    # CSL-to-BibTeX conversion produces correct metadata
-    mock_bibtex_from_csl = dedent("""
-        @inproceedings{Vaswani2017,
-          title = {Attention Is All You Need},
-          author = {Ashish Vaswani and Noam Shazeer},
-          year = {2017}
-        }
-    """).strip()
-    with patch.object(api, 'fetch_csl_via_doi', return_value=mock_csl):
-        with patch.object(api, 'fetch_bibtex_via_doi', return_value=mock_bibtex_wrong):
-            with patch.object(api, 'bibtex_from_csl', return_value=mock_bibtex_from_csl):
-                csl_matched, bibtex_matched, csl_entry, bibtex_entry = validate_doi_candidate(
-                    doi="10.48550/arXiv.1706.03762",
-                    baseline_entry=baseline_entry,
-                    result_id="test"
-                )
+    # CSL matches baseline, and CSL-to-BibTeX conversion produces correct metadata
+    fetchers = _fetchers(_CSL_VASWANI, mock_bibtex_wrong, _BIBTEX_VASWANI)
+    csl_matched, bibtex_matched, csl_entry, bibtex_entry = validate_doi_candidate(
+        doi="10.48550/arXiv.1706.03762",
+        baseline_entry=baseline_entry,
+        result_id="test", fetchers=fetchers
+    )
 
     # CSL should validate, BibTeX should be rejected
     assert csl_matched, "CSL should match"
@@ -117,23 +137,7 @@ def test_validate_doi_candidate_neither_matches():
     """
     Test complete rejection when a DOI resolves to metadata for a different paper.
     """
-    baseline_entry = {
-        'type': 'inproceedings',
-        'key': 'Vaswani2017',
-        'fields': {
-            'title': 'Attention Is All You Need',
-            'author': 'Ashish Vaswani',
-            'year': '2017'
-        }
-    }
-
     # both CSL and BibTeX return metadata for completely different paper (BERT)
-    mock_csl_wrong = {
-        'title': 'BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding',
-        'author': [{'given': 'Jacob', 'family': 'Devlin'}],
-        'issued': {'date-parts': [[2019]]}
-    }
-
     mock_bibtex_wrong = dedent("""
         @inproceedings{Devlin2019,
           title = {BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding},
@@ -141,14 +145,12 @@ def test_validate_doi_candidate_neither_matches():
           year = {2019}
         }
     """).strip()
-    with patch.object(api, 'fetch_csl_via_doi', return_value=mock_csl_wrong):
-        with patch.object(api, 'fetch_bibtex_via_doi', return_value=mock_bibtex_wrong):
-            with patch.object(api, 'bibtex_from_csl', return_value=mock_bibtex_wrong):
-                csl_matched, bibtex_matched, csl_entry, bibtex_entry = validate_doi_candidate(
-                    doi="10.18653/v1/N19-1423", # Real DOI for BERT
-                    baseline_entry=baseline_entry,
-                    result_id="test"
-                )
+    fetchers = _fetchers(_CSL_BERT, mock_bibtex_wrong, mock_bibtex_wrong)
+    csl_matched, bibtex_matched, csl_entry, bibtex_entry = validate_doi_candidate(
+        doi="10.18653/v1/N19-1423", # Real DOI for BERT
+        baseline_entry=_BASELINE_VASWANI,
+        result_id="test", fetchers=fetchers
+    )
 
     # neither format should match; DOI should be rejected entirely
     assert not csl_matched and not bibtex_matched, "Both formats should be rejected"
@@ -158,26 +160,17 @@ def test_validate_doi_candidate_network_errors():
     """
     Verify resilient error handling when DOI resolution fails due to network issues.
     """
-    baseline_entry = {
-        'type': 'inproceedings',
-        'key': 'Vaswani2017',
-        'fields': {
-            'title': 'Attention Is All You Need',
-            'author': 'Ashish Vaswani',
-            'year': '2017'
-        }
-    }
-
     # simulate network failures for both formats
-    with patch.object(api, 'fetch_csl_via_doi', side_effect=urllib.error.URLError("Network error")):
-        with patch.object(api, 'fetch_bibtex_via_doi', side_effect=urllib.error.HTTPError(
-            url='test', code=500, msg='Server Error', hdrs={}, fp=None
-        )):
-            csl_matched, bibtex_matched, csl_entry, bibtex_entry = validate_doi_candidate(
-                doi="10.48550/arXiv.1706.03762",
-                baseline_entry=baseline_entry,
-                result_id="test"
-            )
+    with patch.multiple(
+        api,
+        fetch_csl_via_doi=MagicMock(side_effect=_URL_ERROR),
+        fetch_bibtex_via_doi=MagicMock(side_effect=_HTTP_500),
+    ):
+        csl_matched, bibtex_matched, csl_entry, bibtex_entry = validate_doi_candidate(
+            doi="10.48550/arXiv.1706.03762",
+            baseline_entry=_BASELINE_VASWANI,
+            result_id="test"
+        )
 
     # should gracefully return False without raising exceptions
     assert not csl_matched and not bibtex_matched, "Should handle network errors gracefully"
@@ -188,46 +181,19 @@ def test_validate_doi_candidate_early_vs_late():
     Confirm that validation logic remains consistent between early validation
     and late validation.
     """
-    baseline_entry = {
-        'type': 'inproceedings',
-        'key': 'Vaswani2017',
-        'fields': {
-            'title': 'Attention Is All You Need',
-            'author': 'Ashish Vaswani',
-            'year': '2017'
-        }
-    }
-
-    mock_csl = {
-        'title': 'Attention Is All You Need',
-        'author': [{'given': 'Ashish', 'family': 'Vaswani'}],
-        'issued': {'date-parts': [[2017]]}
-    }
+    fetchers = _fetchers(_CSL_VASWANI, _BIBTEX_VASWANI, _BIBTEX_VASWANI)
 
-    mock_bibtex = dedent("""
-        @inproceedings{Vaswani2017,
-          title = {Attention Is All You Need},
-          author = {Ashish Vaswani and Noam Shazeer},
-          year = {2017}
-        }
-    """).strip()
     # test early validation (baseline has DOI already)
-    with patch.object(api, 'fetch_csl_via_doi', return_value=mock_csl):
-        with patch.object(api, 'fetch_bibtex_via_doi', return_value=mock_bibtex):
-            with patch.object(api, 'bibtex_from_csl', return_value=mock_bibtex):
-                csl_matched_early, _, _, _ = validate_doi_candidate(
-                    doi="10.48550/arXiv.1706.03762", baseline_entry=baseline_entry,
-                    result_id="test"
-                )
+    csl_matched_early, _, _, _ = validate_doi_candidate(
+        doi="10.48550/arXiv.1706.03762", baseline_entry=_BASELINE_VASWANI,
+        result_id="test", fetchers=fetchers
+    )
 
     # test late validation (DOI found during enrichment)
-    with patch.object(api, 'fetch_csl_via_doi', return_value=mock_csl):
-        with patch.object(api, 'fetch_bibtex_via_doi', return_value=mock_bibtex):
-            with patch.object(api, 'bibtex_from_csl', return_value=mock_bibtex):
-                csl_matched_late, _, _, _ = validate_doi_candidate(
-                    doi="10.48550/arXiv.1706.03762", baseline_entry=baseline_entry,
-                    result_id="test"
-                )
+    csl_matched_late, _, _, _ = validate_doi_candidate(
+        doi="10.48550/arXiv.1706.03762", baseline_entry=_BASELINE_VASWANI,
+        result_id="test", fetchers=fetchers
+    )
 
     # both stages should produce identical validation results
     assert csl_matched_early and csl_matched_late, "Both early and late should succeed"
@@ -237,40 +203,15 @@ def test_process_validated_doi_success():
     Verify that successful DOI validation properly updates the enrichment
     tracking structures.
     """
-    baseline_entry = {
-        'type': 'inproceedings',
-        'key': 'Vaswani2017',
-        'fields': {
-            'title': 'Attention Is All You Need',
-            'author': 'Ashish Vaswani',
-            'year': '2017'
-        }
-    }
-
-    mock_csl = {
-        'title': 'Attention Is All You Need',
-        'author': [{'given': 'Ashish', 'family': 'Vaswani'}],
-        'issued': {'date-parts': [[2017]]}
-    }
-
-    mock_bibtex = dedent("""
-        @inproceedings{Vaswani2017,
-          title = {Attention Is All You Need},
-          author = {Ashish Vaswani and Noam Shazeer},
-          year = {2017}
-        }
-    """).strip()
     # track enrichment state before validation
     enr_list = []
     flags = {"doi_csl": False, "doi_bibtex": False}
 
-    with patch.object(api, 'fetch_csl_via_doi', return_value=mock_csl):
-        with patch.object(api, 'fetch_bibtex_via_doi', return_value=mock_bibtex):
-            with patch.object(api, 'bibtex_from_csl', return_value=mock_bibtex):
-                doi_matched = process_validated_doi(
-                    doi="10.48550/arXiv.1706.03762", baseline_entry=baseline_entry,
-                    result_id="test", enr_list=enr_list, flags=flags
-                )
+    fetchers = _fetchers(_CSL_VASWANI, _BIBTEX_VASWANI, _BIBTEX_VASWANI)
+    doi_matched = process_validated_doi(
+        doi="10.48550/arXiv.1706.03762", baseline_entry=_BASELINE_VASWANI,
+        result_id="test", enr_list=enr_list, flags=flags, fetchers=fetchers
+    )
 
     # validation should succeed and populate structures
     assert doi_matched, "Should return True"
@@ -288,23 +229,7 @@ def test_process_validated_doi_failure():
     """
     Confirm that failed DOI validation leaves enrichment structures untouched.
     """
-    baseline_entry = {
-        'type': 'inproceedings',
-        'key': 'Vaswani2017',
-        'fields': {
-            'title': 'Attention Is All You Need',
-            'author': 'Ashish Vaswani',
-            'year': '2017'
-        }
-    }
-
     # DOI resolves to wrong paper metadata (BERT)
-    mock_csl_wrong = {
-        'title': 'BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding',
-        'author': [{'given': 'Jacob', 'family': 'Devlin'}],
-        'issued': {'date-parts': [[2019]]}
-    }
-
     mock_bibtex_wrong = dedent("""
         @inproceedings{Devlin2019,
           title = {BERT: Pre-training of Deep Bidirectional Transformers for Language Understanding},
@@ -316,13 +241,11 @@ def test_process_validated_doi_failure():
     enr_list = []
     flags = {"doi_csl": False, "doi_bibtex": False}
 
-    with patch.object(api, 'fetch_csl_via_doi', return_value=mock_csl_wrong):
-        with patch.object(api, 'fetch_bibtex_via_doi', return_value=mock_bibtex_wrong):
-            with patch.object(api, 'bibtex_from_csl', return_value=mock_bibtex_wrong):
-                doi_matched = process_validated_doi(
-                    doi="10.18653/v1/N19-1423", baseline_entry=baseline_entry,
-                    result_id="test", enr_list=enr_list, flags=flags
-                )
+    fetchers = _fetchers(_CSL_BERT, mock_bibtex_wrong, mock_bibtex_wrong)
+    doi_matched = process_validated_doi(
+        doi="10.18653/v1/N19-1423", baseline_entry=_BASELINE_VASWANI,
+        result_id="test", enr_list=enr_list, flags=flags, fetchers=fetchers
+    )
 
     # validation should fail and leave structures unchanged
     assert not doi_matched, "Should return False"